@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+"""
+Summarize a clock timing recording made with ENGINE_DEBUG_TIMING=1.
+
+Usage: python debug/decode_clock_timing.py [clock_timing.bin] [--dump]
+"""
+
+import statistics
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from sequencer import TIMING_RECORD
+
+
+def main(argv):
+    args = [a for a in argv if a != '--dump']
+    path = args[0] if args else 'clock_timing.bin'
+    with open(path, 'rb') as f:
+        data = f.read()
+    usable = len(data) - len(data) % TIMING_RECORD.size
+    records = list(TIMING_RECORD.iter_unpack(data[:usable]))
+    if not records:
+        print(f"{path}: no tick records")
+        return 1
+
+    if '--dump' in argv:
+        print("tick,deadline,actual,late_us")
+        print("\n".join(
+            f"{tick},{deadline:.6f},{actual:.6f},{(actual - deadline) * 1e6:.1f}"
+            for tick, deadline, actual in records
+        ))
+        return 0
+
+    late_us = sorted((actual - deadline) * 1e6 for _, deadline, actual in records)
+    n = len(late_us)
+    print(f"{path}: {n} ticks over {records[-1][2] - records[0][2]:.1f}s")
+    print(f"lateness us: mean={statistics.fmean(late_us):.1f} median={late_us[n // 2]:.1f} "
+          f"p99={late_us[min(n - 1, n * 99 // 100)]:.1f} max={late_us[-1]:.1f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
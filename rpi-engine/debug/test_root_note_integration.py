@@ -131,7 +131,7 @@ def test_mutation_integration():
     mutation_engine = create_mutation_engine(MockMutationConfig(), state)
     
     # Check that root_note rule exists
-    root_note_rules = [rule for rule in mutation_engine._rules if rule.parameter == 'root_note']
+    root_note_rules = [rule for rule in mutation_engine._rules.values() if rule.parameter == 'root_note']
     assert len(root_note_rules) == 1, f"Expected 1 root_note rule, got {len(root_note_rules)}"
     
     rule = root_note_rules[0]
@@ -4,15 +4,40 @@ Verification script to ensure all MIDI CC inputs are properly routed to semantic
 Compares roadmap specification with current implementation.
 """
 
+import functools
 import sys
 import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
-import yaml
 from config import load_config
 from action_handler import ActionHandler
 from state import State
 
+# Roadmap-specified CC mappings (from ROADMAP.md Section 4)
+ROADMAP_CCS = {
+    "20": "tempo",
+    "21": "filter_cutoff", 
+    "22": "reverb_mix",
+    "23": "swing",
+    "24": "density",
+    "25": "master_volume",
+    "50": "sequence_length",
+    "51": "scale_select", 
+    "52": "chaos_lock",
+    "53": "reserved",
+    "60": "mode",
+    "61": "palette",
+    "62": "drift"
+}
+
+
+@functools.lru_cache(maxsize=1)
+def _get_available_handlers() -> frozenset:
+    """Names of the semantic actions ActionHandler can handle."""
+    handler = ActionHandler(State())
+    return frozenset(handler._action_handlers)
+
+
 def main():
     print("🔍 Verifying MIDI CC Mapping Implementation")
     print("=" * 50)
@@ -21,88 +46,60 @@ def main():
     config = load_config('config.yaml')
     cc_mappings = config.mapping.get('ccs', {})
     
-    # Create action handler to check available handlers
-    state = State()
-    handler = ActionHandler(state)
-    available_handlers = set(handler._action_handlers.keys())
-    
-    # Roadmap-specified CC mappings (from ROADMAP.md Section 4)
-    roadmap_ccs = {
-        "20": "tempo",
-        "21": "filter_cutoff", 
-        "22": "reverb_mix",
-        "23": "swing",
-        "24": "density",
-        "25": "master_volume",
-        "50": "sequence_length",
-        "51": "scale_select", 
-        "52": "chaos_lock",
-        "53": "reserved",
-        "60": "mode",
-        "61": "palette",
-        "62": "drift"
-    }
-    
-    print("📋 Roadmap-specified CC mappings:")
-    for cc, action in roadmap_ccs.items():
-        print(f"  CC {cc:>2} -> {action}")
-    
-    print(f"\n📋 Current config CC mappings:")
-    for cc, action in cc_mappings.items():
-        print(f"  CC {cc:>2} -> {action}")
-    
-    print(f"\n🔧 Available action handlers:")
-    for handler_name in sorted(available_handlers):
-        print(f"  - {handler_name}")
-    
-    print(f"\n✅ Verification Results:")
-    
-    # Check if all roadmap CCs are in config
+    available_handlers = _get_available_handlers()
+    roadmap_ccs = ROADMAP_CCS
+    
+    lines = ["📋 Roadmap-specified CC mappings:"]
+    lines.extend(f"  CC {cc:>2} -> {action}" for cc, action in roadmap_ccs.items())
+    lines.append(f"\n📋 Current config CC mappings:")
+    lines.extend(f"  CC {cc:>2} -> {action}" for cc, action in cc_mappings.items())
+    lines.append(f"\n🔧 Available action handlers:")
+    lines.extend(f"  - {handler_name}" for handler_name in sorted(available_handlers))
+    lines.append(f"\n✅ Verification Results:")
+    print("\n".join(lines))
+    
+    # Check if all roadmap CCs are in config. The items() subset test
+    # covers the all-clean case; the set differences only run when it fails.
+    # Roadmap CCs are listed in ascending order, so sort reports by CC number.
+    roadmap_match = roadmap_ccs.items() <= cc_mappings.items()
     missing_in_config = []
-    for cc, action in roadmap_ccs.items():
-        if cc not in cc_mappings:
-            missing_in_config.append(f"CC {cc} -> {action}")
-        elif cc_mappings[cc] != action:
-            print(f"  ⚠️  CC {cc}: config has '{cc_mappings[cc]}', roadmap expects '{action}'")
+    if not roadmap_match:
+        mismatched = {cc for cc in roadmap_ccs.keys() & cc_mappings.keys()
+                      if roadmap_ccs[cc] != cc_mappings[cc]}
+        for cc in sorted(mismatched, key=int):
+            print(f"  ⚠️  CC {cc}: config has '{cc_mappings[cc]}', roadmap expects '{roadmap_ccs[cc]}'")
+        missing_in_config = [f"CC {cc} -> {roadmap_ccs[cc]}"
+                             for cc in sorted(roadmap_ccs.keys() - cc_mappings.keys(), key=int)]
     
     if missing_in_config:
         print(f"  ❌ Missing in config:")
-        for item in missing_in_config:
-            print(f"     {item}")
+        print("\n".join(f"     {item}" for item in missing_in_config))
     else:
         print(f"  ✅ All roadmap CCs present in config")
     
     # Check if all config actions have handlers
-    missing_handlers = []
-    for cc, action in cc_mappings.items():
-        if action not in available_handlers:
-            missing_handlers.append(f"CC {cc} -> {action}")
+    config_actions = set(cc_mappings.values())
+    handlers_complete = config_actions <= available_handlers
     
-    if missing_handlers:
+    if not handlers_complete:
         print(f"  ❌ Missing action handlers:")
-        for item in missing_handlers:
-            print(f"     {item}")
+        print("\n".join(f"     CC {cc} -> {action}" for cc, action in cc_mappings.items()
+                        if action not in available_handlers))
     else:
         print(f"  ✅ All config actions have handlers")
     
     # Check for extra handlers not used in config
-    config_actions = set(cc_mappings.values())
     unused_handlers = available_handlers - config_actions - {'trigger_step'}  # trigger_step is for buttons
     
     if unused_handlers:
         print(f"  ℹ️  Unused action handlers:")
-        for handler_name in sorted(unused_handlers):
-            print(f"     {handler_name}")
+        print("\n".join(f"     {handler_name}" for handler_name in sorted(unused_handlers)))
     
     # Additional CC we added
     if "26" in cc_mappings and cc_mappings["26"] == "note_probability":
         print(f"  ✅ Added CC 26 -> note_probability (not in roadmap but handler exists)")
     
     print("\n🎯 Summary:")
-    roadmap_match = all(cc in cc_mappings and cc_mappings[cc] == action 
-                       for cc, action in roadmap_ccs.items())
-    handlers_complete = all(action in available_handlers for action in cc_mappings.values())
-    
     if roadmap_match and handlers_complete:
         print("  ✅ All MIDI CC inputs are correctly routed to semantic events!")
     else:
@@ -56,7 +56,7 @@ def main():
     
     # Show mutation rules
     print("\nMutation rules:")
-    for rule in mutation_engine._rules:
+    for rule in mutation_engine._rules.values():
         print(f"  {rule.parameter}: weight={rule.weight}, delta_range={rule.delta_range}, desc='{rule.description}'")
     
     print("\n=== Forcing 3 mutation cycles ===\n")
@@ -93,7 +93,7 @@ class ActionHandler:
         if handler:
             try:
                 handler(event)
-                log.debug(f"action_handled type={event.type} value={event.value}")
+                log.debug("action_handled type=%s value=%s", event.type, event.value)
             except Exception as e:
                 log.error(f"Action handler error for {event.type}: {e}")
         else:
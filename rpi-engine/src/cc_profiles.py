@@ -5,8 +5,8 @@ Includes built-in profiles for common devices and custom profile support.
 """
 
 from __future__ import annotations
-from typing import Dict, Optional, Tuple, Literal, Any
-from dataclasses import dataclass
+from typing import Dict, Optional, Tuple, Literal, Any, Callable, Iterable, List
+from dataclasses import dataclass, field
 from enum import Enum
 import math
 import logging
@@ -22,7 +22,29 @@ class CurveType(str, Enum):
     STEPPED = "stepped"
 
 
-@dataclass
+def _curve_linear(value: float) -> float:
+    return value
+
+
+def _curve_exponential(value: float) -> float:
+    # Exponential curve: y = x^2 for smoother control at low values
+    return value * value
+
+
+def _curve_logarithmic(value: float) -> float:
+    # Logarithmic curve: more precision at high values
+    return math.log10(value * 9 + 1)  # Maps 0-1 to 0-1 via log10(1) to log10(10)
+
+
+# Curve shaping functions on normalized 0.0-1.0 values (stepped uses a lookup table)
+_CURVE_FUNCTIONS: Dict[CurveType, Callable[[float], float]] = {
+    CurveType.LINEAR: _curve_linear,
+    CurveType.EXPONENTIAL: _curve_exponential,
+    CurveType.LOGARITHMIC: _curve_logarithmic,
+}
+
+
+@dataclass(slots=True)
 class CCParameter:
     """Definition of a single CC parameter mapping."""
     cc: int                                    # MIDI CC number (0-127)
@@ -30,6 +52,12 @@ class CCParameter:
     curve: CurveType = CurveType.LINEAR       # Scaling curve
     steps: Optional[int] = None               # Number of steps for stepped parameters
     name: Optional[str] = None                # Human readable name
+    _lo: int = field(default=0, init=False, repr=False, compare=False)
+    _hi: int = field(default=127, init=False, repr=False, compare=False)
+    _span: int = field(default=127, init=False, repr=False, compare=False)
+    _last_step: int = field(default=0, init=False, repr=False, compare=False)
+    _step_lut: Optional[Tuple[int, ...]] = field(default=None, init=False, repr=False, compare=False)
+    _curve_fn: Callable[[float], float] = field(default=_curve_linear, init=False, repr=False, compare=False)
     
     def __post_init__(self):
         # Validate CC number
@@ -43,10 +71,24 @@ class CCParameter:
         if self.range[0] > self.range[1]:
             raise ValueError(f"CC range min must be <= max, got {self.range}")
         
+        # Precompute range constants and resolve the curve once so
+        # scale_value doesn't redo this per call
+        self._lo, self._hi = self.range
+        self._span = self._hi - self._lo
+        self._curve_fn = _CURVE_FUNCTIONS.get(self.curve, _curve_linear)
+        
         # Validate steps for stepped parameters
         if self.curve == CurveType.STEPPED:
             if self.steps is None or self.steps < 2:
                 raise ValueError("Stepped parameters must specify steps >= 2")
+            
+            # Precompute the CC value for every step so scaling is an index lookup
+            lo, hi, span = self._lo, self._hi, self._span
+            self._last_step = last_step = self.steps - 1
+            self._step_lut = tuple(
+                max(lo, min(hi, int(lo + (i / last_step) * span)))
+                for i in range(self.steps)
+            )
     
     def scale_value(self, value: float) -> int:
         """Scale a 0.0-1.0 value to the CC range using the specified curve.
@@ -60,31 +102,20 @@ class CCParameter:
         # Clamp input to valid range
         value = max(0.0, min(1.0, value))
         
-        # Apply curve transformation
-        if self.curve == CurveType.LINEAR:
-            scaled = value
-        elif self.curve == CurveType.EXPONENTIAL:
-            # Exponential curve: y = x^2 for smoother control at low values
-            scaled = value ** 2
-        elif self.curve == CurveType.LOGARITHMIC:
-            # Logarithmic curve: more precision at high values
-            scaled = math.log10(value * 9 + 1)  # Maps 0-1 to 0-1 via log10(1) to log10(10)
-        elif self.curve == CurveType.STEPPED:
-            # Stepped/discrete values
-            if self.steps:
-                step_value = int(value * (self.steps - 1))
-                scaled = step_value / (self.steps - 1)
-            else:
-                scaled = value
-        else:
-            scaled = value
+        # Stepped parameters use the precomputed lookup table
+        if self._step_lut is not None:
+            return self._step_lut[int(value * self._last_step)]
         
-        # Map to CC range
-        range_span = self.range[1] - self.range[0]
-        cc_value = int(self.range[0] + scaled * range_span)
+        # Apply curve transformation
+        scaled = self._curve_fn(value)
         
-        # Ensure within bounds
-        return max(self.range[0], min(self.range[1], cc_value))
+        # Map to CC range. Every curve maps 0.0-1.0 onto 0.0-1.0, so the
+        # result already lies within the range and needs no second clamp.
+        return int(self._lo + scaled * self._span)
+    
+    def scale_values(self, values: Iterable[float]) -> List[int]:
+        """Scale a batch of 0.0-1.0 values to CC values."""
+        return [self.scale_value(value) for value in values]
 
 
 @dataclass 
@@ -108,13 +139,35 @@ class CCProfile:
         Returns:
             Tuple of (CC_number, CC_value) if parameter exists, None otherwise
         """
-        if param_name not in self.parameters:
+        param = self.parameters.get(param_name)
+        if param is None:
             log.warning(f"Parameter '{param_name}' not found in profile '{self.name}'")
             return None
         
-        param = self.parameters[param_name]
-        cc_value = param.scale_value(value)
-        return (param.cc, cc_value)
+        return (param.cc, param.scale_value(value))
+    
+    def map_parameters(self, values: Dict[str, float]) -> Dict[str, Tuple[int, int]]:
+        """Map several parameters at once, e.g. for a scene recall.
+        
+        Args:
+            values: Parameter names mapped to 0.0-1.0 values
+            
+        Returns:
+            Parameter names mapped to (CC_number, CC_value); unknown names are skipped
+        """
+        parameters = self.parameters
+        mapped = {}
+        missing = []
+        for param_name, value in values.items():
+            param = parameters.get(param_name)
+            if param is None:
+                missing.append(param_name)
+            else:
+                mapped[param_name] = (param.cc, param.scale_value(value))
+        
+        if missing:
+            log.warning(f"Parameters {missing} not found in profile '{self.name}'")
+        return mapped
     
     def get_parameter_names(self) -> list[str]:
         """Get list of available parameter names."""
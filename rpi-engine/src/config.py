@@ -1,7 +1,7 @@
 from __future__ import annotations
 from pydantic import BaseModel, Field, field_validator
 from typing import Dict, List, Optional, Any
-import yaml
+import functools
 
 class MidiClockConfig(BaseModel):
     """MIDI clock synchronization configuration."""
@@ -34,11 +34,15 @@ class SequencerConfig(BaseModel):
     # Phase 5.5 features
     step_pattern: Optional[str] = None
     direction_pattern: str = "forward"
+    # Clock thread scheduling (Linux only; ignored where unsupported or not permitted)
+    clock_cpu: Optional[int] = Field(None, ge=0)  # Pin the clock thread to this CPU
+    clock_rt_priority: Optional[int] = Field(None, ge=1, le=99)  # SCHED_FIFO priority for the clock thread
 
 class MutationConfig(BaseModel):
     interval_min_s: int = 120
     interval_max_s: int = 240
     max_changes_per_cycle: int = 2
+    external_tick: bool = False  # Driven by maybe_mutate() from the main loop instead of a thread
 
 class IdleConfig(BaseModel):
     timeout_ms: int = 30000
@@ -79,8 +83,20 @@ class RootConfig(BaseModel):
         return v
 
 
+@functools.cache
+def _yaml_loader():
+    """Import PyYAML on first use and pick its fastest safe loader."""
+    import yaml
+    try:
+        return yaml.CSafeLoader  # libyaml C parser
+    except AttributeError:
+        return yaml.SafeLoader
+
+
 def load_config(path: str) -> RootConfig:
+    import yaml
     with open(path, "r", encoding="utf-8") as fh:
-        data = yaml.safe_load(fh) or {}
-    return RootConfig(**data)
+        data = yaml.load(fh, Loader=_yaml_loader()) or {}
+    # The file is user-edited, so it always gets full validation
+    return RootConfig.model_validate(data)
 
@@ -5,13 +5,15 @@ Phase 6: Idle mode detection and handling.
 """
 
 from __future__ import annotations
-from typing import Dict, Any, Optional, Callable
+from typing import Dict, Any, Optional, Callable, TYPE_CHECKING
 import time
 import logging
 import threading
 from dataclasses import dataclass, field
 from state import State, StateChange
-from config import IdleConfig
+
+if TYPE_CHECKING:
+    from config import IdleConfig
 
 log = logging.getLogger(__name__)
 
@@ -5,21 +5,29 @@ techniques for tight integration with external synthesizers.
 """
 
 from __future__ import annotations
-from typing import Dict, Optional, Callable, Any, Tuple
+from typing import Dict, Optional, Callable, Any, Iterable, Tuple
 from dataclasses import dataclass, field
 import time
 import threading
 import logging
 from collections import deque
 import heapq
+import itertools
 
 log = logging.getLogger(__name__)
 
 
+def _to_ns(when: Optional[float]) -> int:
+    """Convert a time.perf_counter() time in seconds (None for now) to nanoseconds."""
+    if when is None:
+        return time.perf_counter_ns()
+    return round(when * 1_000_000_000)
+
+
 @dataclass
 class TimestampedMessage:
     """MIDI message with precise timing information."""
-    timestamp: float
+    timestamp_ns: int  # time.perf_counter_ns() timeline
     message_type: str  # 'note_on', 'note_off', 'cc'
     data: Dict[str, Any]
     priority: int = 0  # Lower number = higher priority
@@ -58,8 +66,10 @@ class CCThrottler:
             throttle_ms: Minimum milliseconds between CC messages per controller
         """
         self.throttle_ms = throttle_ms
-        self.last_sent: Dict[Tuple[int, int], float] = {}  # (channel, cc) -> timestamp
-        self.pending: Dict[Tuple[int, int], Tuple[int, float]] = {}  # (channel, cc) -> (value, timestamp)
+        # Controllers are keyed by (channel << 7) | cc to avoid per-call tuple keys
+        self.last_sent: list[float] = [0.0] * (32 << 7)  # key -> timestamp
+        self.pending: Dict[int, Tuple[int, float]] = {}  # key -> (value, timestamp)
+        self._next_release = float('inf')  # Earliest time (ms) any pending CC may go out
         self._lock = threading.Lock()
     
     def should_send_cc(self, channel: int, cc: int, value: int) -> bool:
@@ -73,20 +83,23 @@ class CCThrottler:
         Returns:
             True if message should be sent immediately, False if throttled
         """
+        key = ((channel & 0x1F) << 7) | (cc & 0x7F)
         with self._lock:
-            key = (channel, cc)
             now = time.perf_counter() * 1000  # Convert to milliseconds
             
             # Check if enough time has passed since last message
-            last_time = self.last_sent.get(key, 0)
-            if now - last_time >= self.throttle_ms:
+            if now - self.last_sent[key] >= self.throttle_ms:
                 self.last_sent[key] = now
                 # Clear any pending message for this CC
-                self.pending.pop(key, None)
+                if self.pending:
+                    self.pending.pop(key, None)
                 return True
             else:
-                # Store as pending for later transmission
+                # Store as pending for later transmission (latest value wins)
                 self.pending[key] = (value, now)
+                release_at = self.last_sent[key] + self.throttle_ms
+                if release_at < self._next_release:
+                    self._next_release = release_at
                 return False
     
     def get_pending_messages(self) -> list[Tuple[int, int, int]]:
@@ -99,19 +112,31 @@ class CCThrottler:
             ready_messages = []
             now = time.perf_counter() * 1000
             
+            # Nothing can be released before the earliest throttle window ends,
+            # which lets the 1ms processing loop skip the scan entirely
+            if now < self._next_release:
+                return ready_messages
+            
+            last_sent = self.last_sent
+            throttle_ms = self.throttle_ms
+            next_release = float('inf')
+            
             # Check all pending messages
             to_remove = []
-            for (channel, cc), (value, pending_time) in self.pending.items():
-                last_time = self.last_sent.get((channel, cc), 0)
-                if now - last_time >= self.throttle_ms:
-                    ready_messages.append((channel, cc, value))
-                    self.last_sent[(channel, cc)] = now
-                    to_remove.append((channel, cc))
+            for key, (value, pending_time) in self.pending.items():
+                release_at = last_sent[key] + throttle_ms
+                if now >= release_at:
+                    ready_messages.append((key >> 7, key & 0x7F, value))
+                    last_sent[key] = now
+                    to_remove.append(key)
+                elif release_at < next_release:
+                    next_release = release_at
             
             # Remove messages that are now being sent
             for key in to_remove:
-                self.pending.pop(key, None)
+                del self.pending[key]
             
+            self._next_release = next_release
             return ready_messages
 
 
@@ -120,8 +145,9 @@ class PriorityMidiQueue:
     
     def __init__(self, max_size: int = 1000):
         self.max_size = max_size
-        self.queue: list[TimestampedMessage] = []
-        self.sequence = 0  # For stable sorting
+        # Min-heap of (timestamp_ns, priority, sequence, message), earliest first
+        self.queue: list[Tuple[int, int, int, TimestampedMessage]] = []
+        self._sequence = itertools.count()  # For stable sorting
         self._lock = threading.Lock()
     
     def put(self, message: TimestampedMessage) -> bool:
@@ -138,35 +164,26 @@ class PriorityMidiQueue:
                 log.warning("MIDI queue full, dropping message")
                 return False
             
-            # Use negative timestamp for min-heap behavior (earliest first)
-            # Add sequence number for stable sorting
-            priority_tuple = (-message.timestamp, message.priority, self.sequence)
-            heapq.heappush(self.queue, (priority_tuple, message))
-            self.sequence += 1
+            # Sequence number keeps ordering stable and the message out of comparisons
+            heapq.heappush(self.queue, (message.timestamp_ns, message.priority, next(self._sequence), message))
             return True
     
-    def get_ready_messages(self, current_time: float) -> list[TimestampedMessage]:
+    def get_ready_messages(self, current_time_ns: int) -> list[TimestampedMessage]:
         """Get all messages ready for transmission.
         
         Args:
-            current_time: Current time for comparison
+            current_time_ns: Current time.perf_counter_ns() value for comparison
             
         Returns:
             List of messages ready to be sent
         """
         with self._lock:
             ready_messages = []
+            queue = self.queue
             
-            # Extract all messages that are ready
-            while self.queue:
-                priority_tuple, message = self.queue[0]
-                message_time = -priority_tuple[0]  # Convert back from negative
-                
-                if message_time <= current_time:
-                    heapq.heappop(self.queue)
-                    ready_messages.append(message)
-                else:
-                    break  # Queue is sorted, so we can stop here
+            # Extract all messages that are ready (heap top is the earliest)
+            while queue and queue[0][0] <= current_time_ns:
+                ready_messages.append(heapq.heappop(queue)[3])
             
             return ready_messages
     
@@ -233,12 +250,12 @@ class LatencyOptimizer:
             note: MIDI note number
             velocity: Note velocity
             channel: MIDI channel
-            when: Scheduled time (None for immediate)
+            when: Scheduled time.perf_counter() time in seconds (None for immediate)
         """
-        timestamp = when if when is not None else time.perf_counter()
+        timestamp_ns = _to_ns(when)
         
         message = TimestampedMessage(
-            timestamp=timestamp,
+            timestamp_ns=timestamp_ns,
             message_type='note_on',
             data={'note': note, 'velocity': velocity, 'channel': channel},
             priority=1  # High priority for note events
@@ -253,12 +270,12 @@ class LatencyOptimizer:
         Args:
             note: MIDI note number
             channel: MIDI channel
-            when: Scheduled time (None for immediate)
+            when: Scheduled time.perf_counter() time in seconds (None for immediate)
         """
-        timestamp = when if when is not None else time.perf_counter()
+        timestamp_ns = _to_ns(when)
         
         message = TimestampedMessage(
-            timestamp=timestamp,
+            timestamp_ns=timestamp_ns,
             message_type='note_off',
             data={'note': note, 'velocity': 0, 'channel': channel},
             priority=1  # High priority for note events
@@ -274,16 +291,16 @@ class LatencyOptimizer:
             cc: Control change number
             value: Control change value
             channel: MIDI channel
-            when: Scheduled time (None for immediate)
+            when: Scheduled time.perf_counter() time in seconds (None for immediate)
         """
-        timestamp = when if when is not None else time.perf_counter()
+        timestamp_ns = _to_ns(when)
         
         # Check throttling for immediate messages
         if when is None and not self.cc_throttler.should_send_cc(channel, cc, value):
             return  # Message was throttled
         
         message = TimestampedMessage(
-            timestamp=timestamp,
+            timestamp_ns=timestamp_ns,
             message_type='cc',
             data={'cc': cc, 'value': value, 'channel': channel},
             priority=2  # Lower priority than notes
@@ -325,23 +342,47 @@ class LatencyOptimizer:
         except Exception as e:
             log.error(f"Error sending immediate MIDI message: {e}")
     
+    def send_cc_batch(self, messages: Iterable[Tuple[int, int, int]]) -> int:
+        """Send several CC messages immediately, bypassing optimization.
+        
+        Args:
+            messages: (channel, cc, value) tuples, as returned by
+                CCThrottler.get_pending_messages()
+            
+        Returns:
+            Number of messages sent successfully
+        """
+        send_control_change = self.midi_output.send_control_change
+        update_stats = self.stats.update
+        perf_counter = time.perf_counter
+        sent = 0
+        
+        for channel, cc, value in messages:
+            start_time = perf_counter()
+            try:
+                if send_control_change(cc, value, channel):
+                    update_stats((perf_counter() - start_time) * 1000)
+                    sent += 1
+            except Exception as e:
+                log.error(f"Error sending immediate MIDI message: {e}")
+        
+        return sent
+    
     def _process_loop(self) -> None:
         """Background processing loop for optimized message transmission."""
         log.debug("Latency optimizer processing loop started")
         
         while not self._stop_event.is_set():
             try:
-                current_time = time.perf_counter()
-                
                 # Process ready messages from queue
-                ready_messages = self.message_queue.get_ready_messages(current_time)
+                ready_messages = self.message_queue.get_ready_messages(time.perf_counter_ns())
                 for message in ready_messages:
                     self._send_message(message)
                 
                 # Process throttled CC messages
                 pending_ccs = self.cc_throttler.get_pending_messages()
-                for channel, cc, value in pending_ccs:
-                    self.send_immediate('cc', cc=cc, value=value, channel=channel)
+                if pending_ccs:
+                    self.send_cc_batch(pending_ccs)
                 
                 # Sleep briefly to prevent CPU spinning
                 time.sleep(0.001)  # 1ms sleep
@@ -368,9 +409,8 @@ class LatencyOptimizer:
                 self.midi_output.send_control_change(data['cc'], data['value'], data['channel'])
             
             # Update latency stats
-            actual_time = time.perf_counter()
-            intended_latency = (actual_time - message.timestamp) * 1000
-            self.stats.update(abs(intended_latency))
+            intended_latency_ms = (time.perf_counter_ns() - message.timestamp_ns) / 1_000_000
+            self.stats.update(abs(intended_latency_ms))
         
         except Exception as e:
             log.error(f"Error sending scheduled MIDI message: {e}")
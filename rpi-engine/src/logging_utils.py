@@ -1,6 +1,19 @@
 from __future__ import annotations
 import logging
 import os
+import re
+import time
+
+# LogRecord attributes that are part of the line already or not worth emitting
+_RESERVED = frozenset({
+    "name", "msg", "args", "levelname", "levelno", "pathname", "filename",
+    "module", "exc_info", "exc_text", "stack_info", "lineno", "funcName",
+    "created", "msecs", "relativeCreated", "thread", "threadName",
+    "processName", "process", "taskName",
+})
+
+# Same characters as str.isspace(), scanned in C
+_has_space = re.compile(r"\s").search
 
 
 class KeyValueFormatter(logging.Formatter):
@@ -8,6 +21,19 @@ class KeyValueFormatter(logging.Formatter):
 
     default_time_format = "%Y-%m-%dT%H:%M:%S"
     default_msec_format = "%s.%03d"
+    # (whole second, formatted default_time_format) of the last record
+    _time_cache = (None, "")
+
+    def formatTime(self, record: logging.LogRecord, datefmt: str | None = None) -> str:
+        if datefmt:
+            return super().formatTime(record, datefmt)
+        # Records come many per second, so strftime runs once per second
+        sec = int(record.created)
+        cached = self._time_cache
+        if cached[0] != sec:
+            cached = (sec, time.strftime(self.default_time_format, self.converter(record.created)))
+            self._time_cache = cached
+        return self.default_msec_format % (cached[1], record.msecs)
 
     def format(self, record: logging.LogRecord) -> str:  # noqa: D401
         base = [
@@ -16,23 +42,24 @@ class KeyValueFormatter(logging.Formatter):
             f"logger={record.name}",
             f"msg={self._escape(record.getMessage())}",
         ]
-        for k, v in sorted(record.__dict__.items()):
-            if k.startswith("_"):
-                continue
-            if k in {"name","msg","args","levelname","levelno","pathname","filename","module","exc_info","exc_text","stack_info","lineno","funcName","created","msecs","relativeCreated","thread","threadName","processName","process"}:
-                continue
-            base.append(f"{k}={self._escape(v)}")
+        # Extras passed via extra={...}; usually none, so only those get sorted
+        attrs = record.__dict__
+        extras = attrs.keys() - _RESERVED
+        if extras:
+            base.extend(
+                f"{k}={self._escape(attrs[k])}" for k in sorted(extras) if not k.startswith("_")
+            )
         if record.exc_info:
             base.append("exc=1")
         return " ".join(base)
 
     @staticmethod
     def _escape(val) -> str:
-        s = str(val)
-        if any(ch.isspace() for ch in s):
-            s = s.replace('"', "'")
-            return f'"{s}"'
-        return s
+        s = val if type(val) is str else str(val)
+        if _has_space(s) is None:
+            # Common case: bare number or identifier, no copy needed
+            return s
+        return '"' + s.replace('"', "'") + '"'
 
 
 def configure_logging(level: str, *, force: bool = True):
@@ -1,6 +1,8 @@
+import os
 import time
 import logging
 import argparse
+import signal
 import threading
 from typing import Optional
 from dataclasses import dataclass
@@ -15,7 +17,6 @@ from sequencer import create_sequencer, NoteEvent
 from action_handler import ActionHandler
 from mutation import create_mutation_engine
 from idle import create_idle_manager
-from cc_profiles import load_custom_profiles
 
 
 @dataclass
@@ -53,7 +54,7 @@ class NoteScheduler:
     
     def schedule_note_off(self, note: int, channel: int, delay: float):
         """Schedule a note off event after the specified delay."""
-        timestamp = time.time() + delay
+        timestamp = time.perf_counter() + delay
         scheduled = ScheduledNoteOff(note, channel, timestamp)
         
         with self._lock:
@@ -64,7 +65,7 @@ class NoteScheduler:
     def _scheduler_thread(self):
         """Main scheduler thread that processes note off events."""
         while self._running:
-            current_time = time.time()
+            current_time = time.perf_counter()
             notes_to_remove = []
             
             with self._lock:
@@ -100,7 +101,9 @@ def main(argv: Optional[list[str]] = None):
     configure_logging(level)
     log = logging.getLogger("engine")
     log.info("engine_start phase=7 version=0.7.0")
-    log.debug("config_loaded json=%s", cfg.model_dump_json())
+    if log.isEnabledFor(logging.DEBUG):
+        # Serializing the whole config is only worth it when it gets logged
+        log.debug("config_loaded json=%s", cfg.model_dump_json())
 
     # Log all configuration values for transparency
     log.info("=== CONFIGURATION SUMMARY ===")
@@ -165,9 +168,6 @@ def main(argv: Optional[list[str]] = None):
     log.info(f"cc_mappings={cc_mappings}")
     log.info("=== END CONFIGURATION ===")
 
-    # Load custom CC profiles from configuration
-    load_custom_profiles(cfg.model_dump())
-
     # Initialize state and sequencer
     state = get_state()
     
@@ -183,8 +183,27 @@ def main(argv: Optional[list[str]] = None):
         'idle_transition_duration_s': cfg.idle.bpm_transition_duration_s,
     }, source='config')
     
+    # SIGTERM (systemd stop) and SIGINT both end the main loop, so the
+    # cleanup in its `finally` runs and no notes are left hanging. Installed
+    # before any thread starts; a signal during startup ends the loop at once.
+    shutdown = threading.Event()
+    def request_shutdown(signum, frame):
+        log.info(f"shutdown signal={signal.Signals(signum).name}")
+        shutdown.set()
+    signal.signal(signal.SIGTERM, request_shutdown)
+    signal.signal(signal.SIGINT, request_shutdown)
+    
+    # Deliver state change notifications off the writer threads
+    state.start_dispatcher()
+    
     # Create sequencer
     sequencer = create_sequencer(state, cfg.scales)
+    sequencer.clock.set_thread_scheduling(
+        cpu=cfg.sequencer.clock_cpu,
+        rt_priority=cfg.sequencer.clock_rt_priority,
+    )
+    if os.getenv("ENGINE_DEBUG_TIMING"):
+        sequencer.clock.set_timing_file(os.getenv("ENGINE_TIMING_FILE", "clock_timing.bin"))
     
     # Apply Phase 5.5 configuration if present
     if cfg.sequencer.step_pattern:
@@ -236,7 +255,7 @@ def main(argv: Optional[list[str]] = None):
             
             # Clear default rules if requested
             if replace_default:
-                mutation_engine._rules.clear()
+                mutation_engine.clear_rules()
                 log.info("Cleared default mutation rules for NTS-1 plugin")
             
             # Set up NTS-1 mutations
@@ -283,7 +302,8 @@ def main(argv: Optional[list[str]] = None):
         log.error("midi_open_failed error=%s", e)
         return 2
 
-    # Start sequencer
+    # Start sequencer, with notes sent to MIDI off the tick thread
+    sequencer.start_note_dispatcher()
     sequencer.start()
     log.info("sequencer_started")
     
@@ -296,8 +316,7 @@ def main(argv: Optional[list[str]] = None):
     log.info("idle_manager_started")
 
     try:
-        while True:
-            time.sleep(1.0)
+        while not shutdown.wait(1.0):
             # Check for mutations periodically (alternative to threading)
             mutation_engine.maybe_mutate()
             
@@ -309,15 +328,15 @@ def main(argv: Optional[list[str]] = None):
                 log.debug(f"state_snapshot {current_state}")
                 log.debug(f"mutation_stats {mutation_stats}")
                 log.debug(f"idle_status {idle_status}")
-    except KeyboardInterrupt:
-        log.info("shutdown signal=keyboard_interrupt")
     finally:
         try:
             sequencer.stop()
+            sequencer.stop_note_dispatcher()
             mutation_engine.stop()
             idle_manager.stop()
             external_hardware.stop()  # Stop external hardware manager
             note_scheduler.stop()
+            state.stop_dispatcher()
             midi.close()
             if midi_output:
                 midi_output.close()
@@ -13,8 +13,13 @@ from dataclasses import dataclass
 
 log = logging.getLogger(__name__)
 
+# The clock thread sleeps until this close to a tick, then spins to the deadline
+_SPIN_WINDOW_NS = 500_000
+# Upper bound on a single sleep so stop() is noticed promptly at slow tempos
+_MAX_SLEEP_NS = 10_000_000
 
-@dataclass
+
+@dataclass(slots=True)
 class ClockStatus:
     """Status information for MIDI clock."""
     running: bool = False
@@ -64,8 +69,9 @@ class MidiClock:
         
         # Timing
         self._clock_interval = 0.0  # Seconds between clock ticks
-        self._next_tick_time = 0.0
-        self._start_time = 0.0
+        self._clock_interval_ns = 0  # Same interval as int nanoseconds for the clock thread
+        self._next_tick_ns = 0  # time.perf_counter_ns() deadline of the next tick
+        self._start_time_ns = 0
         
         # Callbacks
         self._tick_callback: Optional[Callable[[int], None]] = None
@@ -91,6 +97,7 @@ class MidiClock:
         # MIDI clock runs at 24 PPQN (24 ticks per quarter note)
         # So interval = 60 / (BPM * 24) seconds
         self._clock_interval = 60.0 / (self.status.bpm * 24)
+        self._clock_interval_ns = round(self._clock_interval * 1_000_000_000)
     
     def start(self) -> None:
         """Start the MIDI clock.
@@ -113,8 +120,8 @@ class MidiClock:
         self.midi_sender.send_start()
         
         # Initialize timing
-        self._start_time = time.perf_counter()
-        self._next_tick_time = self._start_time + self._clock_interval
+        self._start_time_ns = time.perf_counter_ns()
+        self._next_tick_ns = self._start_time_ns + self._clock_interval_ns
         
         # Start clock thread
         self._stop_event.clear()
@@ -172,8 +179,7 @@ class MidiClock:
         self.midi_sender.send_continue()
         
         # Restart timing from current position
-        current_time = time.perf_counter()
-        self._next_tick_time = current_time + self._clock_interval
+        self._next_tick_ns = time.perf_counter_ns() + self._clock_interval_ns
         
         # Restart thread
         self._stop_event.clear()
@@ -226,30 +232,37 @@ class MidiClock:
         self._tick_callback = callback
     
     def _clock_loop(self) -> None:
-        """Main clock loop running in separate thread."""
+        """Main clock loop running in separate thread.
+        
+        Sleeps until shortly before each tick and spins for the remainder,
+        since sleep() alone wakes up too late for 24 PPQN at typical tempos.
+        """
         log.debug("MIDI clock thread started")
+        perf_counter_ns = time.perf_counter_ns
         
         while not self._stop_event.is_set():
-            current_time = time.perf_counter()
+            remaining_ns = self._next_tick_ns - perf_counter_ns()
+            
+            if remaining_ns > _SPIN_WINDOW_NS:
+                time.sleep(min(remaining_ns - _SPIN_WINDOW_NS, _MAX_SLEEP_NS) / 1_000_000_000)
+                continue
             
-            # Check if it's time for next tick
-            if current_time >= self._next_tick_time:
-                self._send_tick()
-                
-                # Schedule next tick with drift correction
-                self._next_tick_time += self._clock_interval
-                
-                # Prevent runaway catch-up if we fall too far behind
-                if self._next_tick_time < current_time:
-                    missed_ticks = int((current_time - self._next_tick_time) / self._clock_interval)
-                    if missed_ticks > 5:  # Allow small catch-up but prevent spiral
-                        log.warning(f"MIDI clock fell behind by {missed_ticks} ticks, resetting timing")
-                        self._next_tick_time = current_time + self._clock_interval
+            # Spin out the last stretch to hit the deadline accurately
+            while perf_counter_ns() < self._next_tick_ns:
+                pass
             
-            # Sleep until next tick (but not too long to maintain responsiveness)
-            sleep_time = min(self._next_tick_time - current_time, 0.001)
-            if sleep_time > 0:
-                time.sleep(sleep_time)
+            self._send_tick()
+            
+            # Schedule next tick from the deadline (not from now) to avoid drift
+            self._next_tick_ns += self._clock_interval_ns
+            
+            # Prevent runaway catch-up if we fall too far behind
+            current_ns = perf_counter_ns()
+            if self._next_tick_ns < current_ns:
+                missed_ticks = (current_ns - self._next_tick_ns) // self._clock_interval_ns
+                if missed_ticks > 5:  # Allow small catch-up but prevent spiral
+                    log.warning(f"MIDI clock fell behind by {missed_ticks} ticks, resetting timing")
+                    self._next_tick_ns = current_ns + self._clock_interval_ns
         
         log.debug("MIDI clock thread stopped")
     
@@ -287,14 +300,20 @@ class MidiClockAdapter:
             midi_output: MIDI output instance with send methods
         """
         self.midi_output = midi_output
+        
+        # Realtime messages carry no data, so build them once instead of per tick
+        import mido
+        self._clock_msg = mido.Message('clock')
+        self._start_msg = mido.Message('start')
+        self._stop_msg = mido.Message('stop')
+        self._continue_msg = mido.Message('continue')
     
     def send_clock(self) -> None:
         """Send MIDI clock tick (0xF8)."""
-        if hasattr(self.midi_output, 'port') and self.midi_output.port:
+        port = getattr(self.midi_output, 'port', None)
+        if port:
             try:
-                import mido
-                msg = mido.Message('clock')
-                self.midi_output.port.send(msg)
+                port.send(self._clock_msg)
             except Exception as e:
                 log.error(f"Failed to send MIDI clock: {e}")
     
@@ -302,9 +321,7 @@ class MidiClockAdapter:
         """Send MIDI start message (0xFA)."""
         if hasattr(self.midi_output, 'port') and self.midi_output.port:
             try:
-                import mido
-                msg = mido.Message('start')
-                self.midi_output.port.send(msg)
+                self.midi_output.port.send(self._start_msg)
             except Exception as e:
                 log.error(f"Failed to send MIDI start: {e}")
     
@@ -312,9 +329,7 @@ class MidiClockAdapter:
         """Send MIDI stop message (0xFC)."""
         if hasattr(self.midi_output, 'port') and self.midi_output.port:
             try:
-                import mido
-                msg = mido.Message('stop')
-                self.midi_output.port.send(msg)
+                self.midi_output.port.send(self._stop_msg)
             except Exception as e:
                 log.error(f"Failed to send MIDI stop: {e}")
     
@@ -322,9 +337,7 @@ class MidiClockAdapter:
         """Send MIDI continue message (0xFB)."""
         if hasattr(self.midi_output, 'port') and self.midi_output.port:
             try:
-                import mido
-                msg = mido.Message('continue')
-                self.midi_output.port.send(msg)
+                self.midi_output.port.send(self._continue_msg)
             except Exception as e:
                 log.error(f"Failed to send MIDI continue: {e}")
     
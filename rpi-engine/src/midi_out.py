@@ -112,7 +112,7 @@ class MidiOutput:
             ch = (channel or self.channel) - 1  # Convert to 0-based
             msg = mido.Message('note_on', channel=ch, note=note, velocity=velocity)
             self.port.send(msg)
-            log.debug(f"Sent Note On: note={note} velocity={velocity} channel={channel or self.channel}")
+            log.debug("Sent Note On: note=%s velocity=%s channel=%s", note, velocity, channel or self.channel)
             return True
             
         except Exception as e:
@@ -138,7 +138,7 @@ class MidiOutput:
             ch = (channel or self.channel) - 1  # Convert to 0-based
             msg = mido.Message('note_off', channel=ch, note=note, velocity=velocity)
             self.port.send(msg)
-            log.debug(f"Sent Note Off: note={note} velocity={velocity} channel={channel or self.channel}")
+            log.debug("Sent Note Off: note=%s velocity=%s channel=%s", note, velocity, channel or self.channel)
             return True
             
         except Exception as e:
@@ -164,7 +164,7 @@ class MidiOutput:
             ch = (channel or self.channel) - 1  # Convert to 0-based
             msg = mido.Message('control_change', channel=ch, control=control, value=value)
             self.port.send(msg)
-            log.debug(f"Sent CC: control={control} value={value} channel={channel or self.channel}")
+            log.debug("Sent CC: control=%s value=%s channel=%s", control, value, channel or self.channel)
             return True
             
         except Exception as e:
@@ -6,34 +6,62 @@ Provides weighted random parameter selection and bounded delta application.
 """
 
 from __future__ import annotations
+import os
 import random
 import time
 import threading
 import logging
 from typing import Dict, List, Callable, Optional, Tuple, TYPE_CHECKING
 from dataclasses import dataclass, field
-from config import MutationConfig
 from state import State, StateChange
 
 if TYPE_CHECKING:
+    from config import MutationConfig
     from idle import IdleManager
 
 log = logging.getLogger(__name__)
 
+# Value bounds for core state parameters (mirrors State validation ranges)
+DEFAULT_BOUNDS: Dict[str, Tuple[float, float]] = {
+    "bpm": (1.0, 200.0),
+    "swing": (0.0, 0.5),
+    "density": (0.0, 1.0),
+    "note_probability": (0.0, 1.0),
+    "sequence_length": (1, 32),
+    "root_note": (0, 127),
+    "filter_cutoff": (0, 127),
+    "reverb_mix": (0, 127),
+    "master_volume": (0, 127),
+    "drift": (-0.2, 0.2),
+}
 
-@dataclass
+_UNBOUNDED: Tuple[float, float] = (float("-inf"), float("inf"))
+
+
+@dataclass(slots=True, frozen=True)
 class MutationRule:
-    """Defines how a parameter can be mutated."""
+    """Defines how a parameter can be mutated.
+    
+    Rules are immutable so cached rule sets can be shared between engines.
+    """
     parameter: str
     weight: float = 1.0  # Higher weight = more likely to be selected
     delta_range: Tuple[float, float] = (-0.1, 0.1)  # Min/max delta values
     delta_scale: float = 1.0  # Scale factor for delta application
     description: str = ""
+    bounds: Optional[Tuple[float, float]] = None  # Min/max value, falls back to DEFAULT_BOUNDS
+    # Delta range pre-multiplied by delta_scale (derived in __post_init__)
+    _scaled_lo: float = field(init=False, repr=False, compare=False)
+    _scaled_hi: float = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        object.__setattr__(self, "_scaled_lo", self.delta_range[0] * self.delta_scale)
+        object.__setattr__(self, "_scaled_hi", self.delta_range[1] * self.delta_scale)
     
-    def apply_delta(self, current_value: float) -> float:
+    def apply_delta(self, current_value: float, rng: Optional[random.Random] = None) -> float:
         """Apply a random delta to the current value."""
-        delta = random.uniform(self.delta_range[0], self.delta_range[1])
-        return current_value + (delta * self.delta_scale)
+        uniform = rng.uniform if rng is not None else random.uniform
+        return current_value + uniform(self._scaled_lo, self._scaled_hi)
 
 
 @dataclass
@@ -58,15 +86,26 @@ class MutationEngine:
     def __init__(self, config: MutationConfig, state: State):
         self.config = config
         self.state = state
-        self._rules: List[MutationRule] = []
+        # Bound State accessors for the mutation hot path (state identity is fixed)
+        self._state_get = state.get
+        self._state_set = state.set
+        self._rules: Dict[str, MutationRule] = {}  # parameter -> rule (insertion ordered)
+        self._bounds: Dict[str, Tuple[float, float]] = {}  # parameter -> (min, max)
+        self._total_weight = 0.0  # Sum of rule weights, maintained by add/remove
         self._history: List[MutationEvent] = []
         self._max_history = 100  # Keep last 100 mutations
         
+        # Engine-local RNG (avoids contending on the shared module-level generator)
+        self._rng = random.Random(os.urandom(8))
+        
         # Threading
         self._lock = threading.RLock()
         self._running = False
         self._thread: Optional[threading.Thread] = None
-        self._next_mutation_time = 0.0
+        self._stop_event = threading.Event()
+        self._started = threading.Event()  # Set by the thread once it is running
+        self._stopped = threading.Event()  # Set once the thread has been joined
+        self._next_mutation_time_ns = 0  # time.monotonic_ns() deadline
         
         # State listener for logging changes
         self._mutation_listener: Optional[Callable[[StateChange], None]] = None
@@ -82,7 +121,7 @@ class MutationEngine:
     
     def _init_default_rules(self):
         """Initialize default mutation rules for various parameters."""
-        self._rules = [
+        default_rules = [
             # Timing and rhythm parameters
             MutationRule(
                 parameter="bpm",
@@ -156,22 +195,52 @@ class MutationEngine:
                 description="BPM drift envelope"
             ),
         ]
+        for rule in default_rules:
+            self._rules[rule.parameter] = rule
+            self._total_weight += rule.weight
+            self._register_bounds(rule)
+    
+    def _register_bounds(self, rule: MutationRule):
+        """Record the value bounds used to clamp mutations of a rule's parameter."""
+        bounds = rule.bounds or DEFAULT_BOUNDS.get(rule.parameter)
+        if bounds is not None:
+            self._bounds[rule.parameter] = bounds
     
     def add_rule(self, rule: MutationRule):
-        """Add a custom mutation rule."""
+        """Add a custom mutation rule.
+        
+        Rules are keyed by parameter; adding a rule for a parameter that
+        already has one replaces the existing rule.
+        """
         with self._lock:
-            self._rules.append(rule)
+            replaced = self._rules.get(rule.parameter)
+            if replaced is not None:
+                self._total_weight -= replaced.weight
+            self._rules[rule.parameter] = rule
+            self._total_weight += rule.weight
+            # Drop any clamp left by the rule being replaced
+            self._bounds.pop(rule.parameter, None)
+            self._register_bounds(rule)
             log.debug(f"mutation_rule_added parameter={rule.parameter} weight={rule.weight}")
     
     def remove_rule(self, parameter: str) -> bool:
         """Remove mutation rule for a parameter."""
         with self._lock:
-            for i, rule in enumerate(self._rules):
-                if rule.parameter == parameter:
-                    removed = self._rules.pop(i)
-                    log.debug(f"mutation_rule_removed parameter={removed.parameter}")
-                    return True
-            return False
+            removed = self._rules.pop(parameter, None)
+            if removed is None:
+                return False
+            self._total_weight -= removed.weight
+            self._bounds.pop(parameter, None)
+            log.debug(f"mutation_rule_removed parameter={removed.parameter}")
+            return True
+    
+    def clear_rules(self):
+        """Remove all mutation rules."""
+        with self._lock:
+            self._rules.clear()
+            self._total_weight = 0.0
+            self._bounds.clear()
+            log.debug("mutation_rules_cleared")
     
     def set_idle_manager(self, idle_manager: IdleManager):
         """Set the idle manager for idle mode awareness."""
@@ -196,7 +265,11 @@ class MutationEngine:
             return self._mutations_enabled
     
     def start(self):
-        """Start the mutation engine thread."""
+        """Start the mutation engine.
+        
+        Spawns the scheduling thread unless config.external_tick is set, in
+        which case the owner is expected to call maybe_mutate() periodically.
+        """
         if self._running:
             return
         
@@ -209,6 +282,13 @@ class MutationEngine:
                 self._mutation_listener = self._on_state_change
                 self.state.add_listener(self._mutation_listener)
             
+            if self.config.external_tick:
+                log.info("mutation_engine_started driver=external_tick")
+                return
+            
+            self._stop_event.clear()
+            self._started.clear()
+            self._stopped.clear()
             self._thread = threading.Thread(target=self._mutation_thread, daemon=True)
             self._thread.start()
             
@@ -221,25 +301,27 @@ class MutationEngine:
                 return
             
             self._running = False
+            self._stop_event.set()
             
             # Remove state listener
             if self._mutation_listener:
                 self.state.remove_listener(self._mutation_listener)
                 self._mutation_listener = None
         
-        # Wait for thread to finish
+        # Wait for thread to finish (no thread when driven by external tick)
         if self._thread:
             self._thread.join(timeout=1.0)
+        self._stopped.set()
         
         log.info("mutation_engine_stopped")
     
     def maybe_mutate(self):
         """Check if it's time to mutate and do so if needed.
         
-        This method can be called from the main loop for manual triggering.
+        This is the scheduling driver when config.external_tick is set, and can
+        also be called from the main loop for manual triggering.
         """
-        current_time = time.time()
-        if current_time >= self._next_mutation_time:
+        if time.monotonic_ns() >= self._next_mutation_time_ns:
             self._perform_mutation_cycle()
     
     def force_mutation(self):
@@ -257,38 +339,37 @@ class MutationEngine:
     def get_stats(self) -> Dict:
         """Get mutation engine statistics."""
         with self._lock:
-            current_time = time.time()
-            time_to_next = max(0.0, self._next_mutation_time - current_time)
+            time_to_next_ns = max(0, self._next_mutation_time_ns - time.monotonic_ns())
             
             return {
                 "running": self._running,
                 "mutations_enabled": self._mutations_enabled,
                 "total_mutations": len(self._history),
                 "rules_count": len(self._rules),
-                "time_to_next_mutation_s": time_to_next,
-                "next_mutation_time": self._next_mutation_time,
+                "total_weight": self._total_weight,
+                "time_to_next_mutation_s": time_to_next_ns / 1e9,
             }
     
     def _schedule_next_mutation(self):
         """Schedule the next mutation cycle."""
-        interval = random.uniform(self.config.interval_min_s, self.config.interval_max_s)
-        self._next_mutation_time = time.time() + interval
-        log.debug(f"mutation_scheduled interval={interval:.1f}s next_time={self._next_mutation_time:.1f}")
+        interval = self._rng.uniform(self.config.interval_min_s, self.config.interval_max_s)
+        self._next_mutation_time_ns = time.monotonic_ns() + int(interval * 1e9)
+        log.debug(f"mutation_scheduled interval={interval:.1f}s")
     
     def _mutation_thread(self):
         """Main mutation thread that checks for scheduled mutations."""
+        self._started.set()
         while self._running:
             try:
-                current_time = time.time()
-                if current_time >= self._next_mutation_time:
+                if time.monotonic_ns() >= self._next_mutation_time_ns:
                     self._perform_mutation_cycle()
                 
-                # Sleep for a short time to avoid busy waiting
-                time.sleep(1.0)
+                # Wait a short time to avoid busy waiting (wakes early on stop)
+                self._stop_event.wait(1.0)
                 
             except Exception as e:
                 log.error(f"mutation_thread_error error={e}")
-                time.sleep(5.0)  # Back off on errors
+                self._stop_event.wait(5.0)  # Back off on errors
     
     def _perform_mutation_cycle(self):
         """Perform a complete mutation cycle."""
@@ -311,12 +392,9 @@ class MutationEngine:
                 self._schedule_next_mutation()
                 return
             
-            mutations_applied = 0
-            
             # Apply mutations
-            for rule in selected_rules:
-                if self._apply_mutation(rule):
-                    mutations_applied += 1
+            apply_mutation = self._apply_mutation
+            mutations_applied = sum(1 for rule in selected_rules if apply_mutation(rule))
             
             log.info(f"mutation_cycle_complete rules_selected={len(selected_rules)} mutations_applied={mutations_applied}")
             
@@ -332,83 +410,86 @@ class MutationEngine:
         if max_changes <= 0:
             return []
         
-        # Create weighted list
-        weighted_rules = []
-        for rule in self._rules:
-            # Check if parameter exists in state
-            current_value = self.state.get(rule.parameter)
-            if current_value is not None:
-                weighted_rules.append(rule)
-        
-        if not weighted_rules:
-            return []
+        # Create weighted list, starting from the cached total weight and
+        # discounting rules whose parameter does not exist in state
+        state_get = self._state_get
+        available_rules = []
+        total_weight = self._total_weight
+        for rule in self._rules.values():
+            if state_get(rule.parameter) is not None:
+                available_rules.append(rule)
+            else:
+                total_weight -= rule.weight
         
         # Select rules without replacement using weighted selection
         selected = []
-        available_rules = weighted_rules.copy()
+        random_value = self._rng.random
         
         for _ in range(max_changes):
-            if not available_rules:
-                break
-            
-            # Calculate total weight
-            total_weight = sum(rule.weight for rule in available_rules)
-            if total_weight <= 0:
+            if not available_rules or total_weight <= 0:
                 break
             
-            # Select rule
-            target = random.uniform(0, total_weight)
+            # Select rule (fall back to the last rule if float error leaves
+            # the cumulative sum just short of the target)
+            target = random_value() * total_weight
             cumulative = 0.0
-            
+            index = len(available_rules) - 1
             for i, rule in enumerate(available_rules):
                 cumulative += rule.weight
                 if cumulative >= target:
-                    selected.append(rule)
-                    available_rules.pop(i)
+                    index = i
                     break
+            
+            rule = available_rules.pop(index)
+            selected.append(rule)
+            total_weight -= rule.weight
         
         return selected
     
     def _apply_mutation(self, rule: MutationRule) -> bool:
         """Apply a single mutation rule."""
-        current_value = self.state.get(rule.parameter)
+        parameter = rule.parameter
+        state_get = self._state_get
+        current_value = state_get(parameter)
         if current_value is None:
-            log.warning(f"mutation_skipped parameter={rule.parameter} reason=not_found")
+            log.warning(f"mutation_skipped parameter={parameter} reason=not_found")
             return False
         
         try:
-            # Calculate new value
-            new_value = rule.apply_delta(float(current_value))
-            delta = new_value - float(current_value)
+            # Calculate new value and clamp to the parameter's bounds
+            old_value = float(current_value)
+            new_value = rule.apply_delta(old_value, self._rng)
+            lo, hi = self._bounds.get(parameter, _UNBOUNDED)
+            new_value = hi if new_value > hi else (lo if new_value < lo else new_value)
+            delta = new_value - old_value
             
             # Apply the change (State will handle validation/clamping)
-            if self.state.set(rule.parameter, new_value, source="mutation"):
+            if self._state_set(parameter, new_value, source="mutation"):
                 # Get the actual value that was set (after validation)
-                final_value = self.state.get(rule.parameter)
+                final_value = state_get(parameter)
                 
                 # Record mutation event
-                event = MutationEvent(
-                    parameter=rule.parameter,
-                    old_value=float(current_value),
+                history = self._history
+                history.append(MutationEvent(
+                    parameter=parameter,
+                    old_value=old_value,
                     new_value=float(final_value),
                     delta=delta,
                     rule_description=rule.description
-                )
-                
-                self._history.append(event)
+                ))
                 
-                # Trim history if needed
-                if len(self._history) > self._max_history:
-                    self._history = self._history[-self._max_history:]
+                # Trim history in place if needed
+                if len(history) > self._max_history:
+                    del history[:-self._max_history]
                 
-                log.info(f"mutation_applied parameter={rule.parameter} old={current_value} new={final_value} delta={delta:.3f} description={rule.description}")
+                log.info(f"mutation_applied parameter={parameter} old={current_value} new={final_value} delta={delta:.3f} description={rule.description}")
                 return True
             else:
-                log.debug(f"mutation_no_change parameter={rule.parameter} value={current_value}")
+                log.debug(f"mutation_no_change parameter={parameter} value={current_value}")
                 return False
                 
         except Exception as e:
-            log.error(f"mutation_failed parameter={rule.parameter} error={e}")
+            log.error(f"mutation_failed parameter={parameter} error={e}")
             return False
     
     def _on_state_change(self, change: StateChange):
@@ -42,7 +42,7 @@ def integrate_nts1_plugin(mutation_engine, state, config_data: dict) -> bool:
         replace_default = nts1_config.get("replace_default_rules", False)
         if replace_default:
             # Clear existing rules
-            mutation_engine._rules.clear()
+            mutation_engine.clear_rules()
             log.info("Cleared default mutation rules for NTS-1 plugin")
         
         # Set up NTS-1 mutations
@@ -6,8 +6,9 @@ Based on the official MIDI implementation document.
 """
 
 from __future__ import annotations
+import functools
 import logging
-from typing import List, TYPE_CHECKING
+from typing import Tuple, TYPE_CHECKING
 from mutation import MutationRule
 
 if TYPE_CHECKING:
@@ -15,14 +16,15 @@ if TYPE_CHECKING:
 
 log = logging.getLogger(__name__)
 
-
-def get_nts1_mutation_rules() -> List[MutationRule]:
+@functools.cache
+def get_nts1_mutation_rules() -> Tuple[MutationRule, ...]:
     """Return comprehensive mutation rules for the Korg NTS-1 mkII.
     
     These rules are carefully weighted and scaled to provide musically
-    meaningful mutations while maintaining sonic coherence.
+    meaningful mutations while maintaining sonic coherence. The result is
+    built once and cached; copy it before modifying.
     """
-    return [
+    return (
         # === OSCILLATOR SECTION ===
         
         # Oscillator Type (stepped parameter - rare mutations)
@@ -296,16 +298,17 @@ def get_nts1_mutation_rules() -> List[MutationRule]:
             delta_scale=1.0,
             description="Master volume breathing"
         ),
-    ]
+    )
 
 
-def get_nts1_ambient_rules() -> List[MutationRule]:
+@functools.cache
+def get_nts1_ambient_rules() -> Tuple[MutationRule, ...]:
     """Return NTS-1 mutation rules optimized for ambient/atmospheric music.
     
     These rules emphasize slow, evolving changes suitable for atmospheric
     compositions and idle modes.
     """
-    return [
+    return (
         # Gentle filter movements
         MutationRule(
             parameter="filter_cutoff",
@@ -387,16 +390,17 @@ def get_nts1_ambient_rules() -> List[MutationRule]:
             delta_scale=0.7,
             description="Slow tremolo rate"
         ),
-    ]
+    )
 
 
-def get_nts1_rhythmic_rules() -> List[MutationRule]:
+@functools.cache
+def get_nts1_rhythmic_rules() -> Tuple[MutationRule, ...]:
     """Return NTS-1 mutation rules optimized for rhythmic/percussive music.
     
     These rules emphasize quick changes and rhythmic elements suitable
     for dance, techno, and beat-oriented compositions.
     """
-    return [
+    return (
         # Quick filter sweeps
         MutationRule(
             parameter="filter_cutoff",
@@ -471,7 +475,7 @@ def get_nts1_rhythmic_rules() -> List[MutationRule]:
             delta_scale=1.0,
             description="Controlled reverb for space"
         ),
-    ]
+    )
 
 
 def register_nts1_rules(mutation_engine: MutationEngine, style: str = "default") -> None:
@@ -553,10 +557,8 @@ def register_nts1_state_parameters(state) -> None:
         "arp_length": 64,     # Medium length
     }
     
-    for param, value in nts1_defaults.items():
-        # Only set if parameter doesn't already exist
-        if state.get(param) is None:
-            state.set(param, value, source="nts1_plugin_init")
+    # Only set parameters that don't already exist, in a single batch
+    state.update_multiple(nts1_defaults, source="nts1_plugin_init", overwrite=False)
     
     log.info(f"nts1_state_parameters_initialized count={len(nts1_defaults)}")
 
@@ -1,13 +1,33 @@
 from __future__ import annotations
-from typing import Dict, Callable
+from typing import Dict, Callable, List, Optional, TYPE_CHECKING
+import functools
 import logging
 from mido import Message
-from config import RootConfig
 from events import SemanticEvent
 
+if TYPE_CHECKING:
+    from config import RootConfig
+
 log = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=256)
+def _parse_note_key(key: str) -> range:
+    """Parse a mapping.buttons key ("60" or "60-69") into the notes it covers."""
+    if "-" not in key:
+        n = int(key)
+        return range(n, n + 1)
+    start, end = key.split("-", 1)
+    try:
+        s = int(start)
+        e = int(end)
+    except ValueError:
+        raise ValueError(f"Invalid note range '{key}' in mapping.buttons")
+    if s > e:
+        raise ValueError(f"Reversed range '{key}' in mapping.buttons")
+    return range(s, e + 1)
+
+
 class Router:
     """Map raw MIDI messages to semantic events according to config.
 
@@ -23,29 +43,34 @@ class Router:
         self.emit = emit
         self.note_map: Dict[int, str] = {}
         self.cc_map: Dict[int, str] = {}
+        # Flat 0-127 lookup tables built from the maps above (None = unmapped)
+        self._note_actions: List[Optional[str]] = [None] * 128
+        self._cc_actions: List[Optional[str]] = [None] * 128
+        self._channel = cfg.midi.input_channel - 1  # mido channels are 0-based
+        self._dispatch: Dict[str, Callable[[Message], None]] = {
+            "note_on": self._route_note,
+            "control_change": self._route_cc,
+        }
         self._build_maps()
 
     def _build_maps(self):
         buttons = self.cfg.mapping.get("buttons", {})
         for k, action in buttons.items():
-            if "-" in k:
-                start, end = k.split("-", 1)
-                try:
-                    s = int(start)
-                    e = int(end)
-                except ValueError:
-                    raise ValueError(f"Invalid note range '{k}' in mapping.buttons")
-                if s > e:
-                    raise ValueError(f"Reversed range '{k}' in mapping.buttons")
-                for n in range(s, e + 1):
-                    self.note_map[n] = action
-            else:
-                self.note_map[int(k)] = action
+            for n in _parse_note_key(k):
+                self.note_map[n] = action
 
         ccs = self.cfg.mapping.get("ccs", {})
         for k, action in ccs.items():
             self.cc_map[int(k)] = action
 
+        # Numbers outside 0-127 can never arrive over MIDI, so leave them out
+        for n, action in self.note_map.items():
+            if 0 <= n < 128:
+                self._note_actions[n] = action
+        for n, action in self.cc_map.items():
+            if 0 <= n < 128:
+                self._cc_actions[n] = action
+
         log.debug(
             "Router maps built note_map=%s cc_map=%s", self.note_map, self.cc_map
         )
@@ -55,38 +80,39 @@ class Router:
 
         Config input_channel is 1-based; mido uses 0-based.
         """
-        channel_conf = self.cfg.midi.input_channel - 1
-        if hasattr(msg, "channel") and msg.channel != channel_conf:
+        if hasattr(msg, "channel") and msg.channel != self._channel:
             return
 
-        if msg.type in ("note_on", "note_off"):
-            note = msg.note
-            action = self.note_map.get(note)
-            if not action:
-                return
-            if msg.type == "note_off" or msg.velocity == 0:
-                # Phase 1 ignores releases.
-                return
-            evt = SemanticEvent(
-                type=action,
-                source="button",
-                value=msg.velocity,
-                raw_note=note,
-                channel=msg.channel + 1,
-            )
-            self.emit(evt)
+        # Phase 1 ignores releases, so note_off has no handler.
+        handler = self._dispatch.get(msg.type)
+        if handler is not None:
+            handler(msg)
+
+    def _route_note(self, msg: Message):
+        note = msg.note
+        action = self._note_actions[note]
+        if not action or msg.velocity == 0:
+            # Unmapped, or a note_on with velocity 0 (a release).
             return
+        evt = SemanticEvent(
+            type=action,
+            source="button",
+            value=msg.velocity,
+            raw_note=note,
+            channel=msg.channel + 1,
+        )
+        self.emit(evt)
 
-        if msg.type == "control_change":
-            cc = msg.control
-            action = self.cc_map.get(cc)
-            if not action:
-                return
-            evt = SemanticEvent(
-                type=action,
-                source="cc",
-                value=msg.value,
-                raw_cc=cc,
-                channel=msg.channel + 1,
-            )
-            self.emit(evt)
+    def _route_cc(self, msg: Message):
+        cc = msg.control
+        action = self._cc_actions[cc]
+        if not action:
+            return
+        evt = SemanticEvent(
+            type=action,
+            source="cc",
+            value=msg.value,
+            raw_cc=cc,
+            channel=msg.channel + 1,
+        )
+        self.emit(evt)
@@ -30,6 +30,15 @@ class ScaleMapper:
         self.current_scale_name: str = "major"
         self.current_scale_intervals: List[int] = self.scale_definitions["major"]
         self.root_note: int = 60  # C4
+        self._build_note_table()
+
+    def _build_note_table(self):
+        """Precompute the notes of the current scale's root octave.
+
+        get_note() then needs one divmod and one tuple index per call.
+        """
+        self._scale_notes = tuple(self.root_note + interval for interval in self.current_scale_intervals)
+        self._scale_len = len(self._scale_notes)
 
     def set_scale(self, scale_name: str, root_note: int = 60):
         """
@@ -44,6 +53,7 @@ class ScaleMapper:
             self.current_scale_name = scale_name
             self.current_scale_intervals = self.scale_definitions[scale_name]
             self.root_note = root_note
+            self._build_note_table()
         else:
             raise ValueError(f"Scale '{scale_name}' not defined.")
 
@@ -58,14 +68,12 @@ class ScaleMapper:
         Returns:
             The MIDI note number.
         """
-        if not self.current_scale_intervals:
+        scale_len = self._scale_len
+        if not scale_len:
             return self.root_note
 
-        scale_len = len(self.current_scale_intervals)
-        octave_offset = (degree // scale_len) * 12
-        interval = self.current_scale_intervals[degree % scale_len]
-
-        return self.root_note + interval + (octave * 12) + octave_offset
+        octave_shift, index = divmod(degree, scale_len)
+        return self._scale_notes[index] + (octave + octave_shift) * 12
 
     def get_notes(self, num_notes: int, start_degree: int = 0, octave: int = 0) -> List[int]:
         """
@@ -5,19 +5,126 @@ Provides high-resolution clock with drift correction and step management.
 """
 
 from __future__ import annotations
-from typing import Callable, Optional, Generator, List
+from typing import Callable, Dict, Optional, Generator, List
+from collections import deque
 from dataclasses import dataclass
+import functools
+import os
+import queue
 import time
 import threading
 import logging
 import random
-from state import State, StateChange
+import struct
+from state import State, StateChange, BATCH_PARAMETER
 from scale_mapper import ScaleMapper
 
 log = logging.getLogger(__name__)
 
+# How long before a tick the clock thread stops sleeping and spins instead
+_SPIN_WINDOW_S = 0.0005
 
-@dataclass
+# Ticks the clock may fall behind before it resets instead of catching up
+_MAX_CATCH_UP_TICKS = 5
+
+# Tick timing record: tick count, deadline, actual perf_counter() time
+TIMING_RECORD = struct.Struct('<Qdd')
+
+# Write buffer for the timing file, so the clock thread rarely touches disk
+_TIMING_BUFFER_BYTES = 1 << 20
+
+# Longest sequence State allows (its sequence_length clamp)
+_MAX_STEPS = 32
+
+# Parameters _generate_step_note reads each step, with their defaults
+_NOTE_PARAMS = {
+    'density': 0.85,
+    'step_probabilities': None,
+    'note_probability': 0.9,
+    'step_pattern': None,
+    'base_velocity': 80,
+    'velocity_range': 40,
+    'base_gate_length': 0.8,
+    'gate_length_range': 0.3,
+}
+
+
+def _ping_pong_move(current_step: int, direction: int, sequence_length: int) -> tuple:
+    """One ping-pong move: returns (next_step, new_direction)."""
+    next_step = current_step + direction
+    
+    # Check for boundaries and reverse direction
+    if next_step >= sequence_length:
+        direction = -1
+        next_step = sequence_length - 2  # Bounce back
+    elif next_step < 0:
+        direction = 1
+        next_step = 1  # Bounce forward
+    
+    return max(0, min(sequence_length - 1, next_step)), direction
+
+
+@functools.lru_cache(maxsize=32)
+def _ping_pong_table(sequence_length: int) -> tuple:
+    """Precomputed ping-pong moves for a sequence length.
+    
+    Indexed as table[direction > 0][current_step] -> (next_step, new_direction).
+    """
+    return tuple(
+        tuple(_ping_pong_move(step, direction, sequence_length) for step in range(sequence_length))
+        for direction in (-1, 1)
+    )
+
+
+_PATTERN_PRESETS = {
+    'four_on_floor': (True, False, False, False, True, False, False, False),
+    'offbeat': (False, True, False, True, False, True, False, True),
+    'every_other': (True, False, True, False, True, False, True, False),
+    'syncopated': (True, False, True, True, False, True, False, False),
+    'dense': (True, True, False, True, True, False, True, True),
+    'sparse': (True, False, False, False, False, False, True, False),
+    'all_on': (True,) * 8,
+    'all_off': (False,) * 8,
+}
+
+# Deterministic probability presets; 'random_low'/'random_high' are drawn per call
+_PROBABILITY_PRESETS = {
+    'uniform': lambda i, last: 0.9,
+    'crescendo': lambda i, last: 0.3 + (i * 0.6 / last),
+    'diminuendo': lambda i, last: 0.9 - (i * 0.6 / last),
+    'peaks': lambda i, last: 0.9 if i % 4 == 0 else 0.4,
+    'valleys': lambda i, last: 0.3 if i % 4 == 0 else 0.8,
+    'alternating': lambda i, last: 0.9 if i % 2 == 0 else 0.3,
+}
+
+_RANDOM_PROBABILITY_PRESETS = {
+    'random_low': (0.2, 0.6),
+    'random_high': (0.6, 1.0),
+}
+
+
+@functools.lru_cache(maxsize=64)
+def _probability_preset(preset_name: str, length: int) -> tuple:
+    """Build a deterministic probability preset once per (name, length)."""
+    value_at = _PROBABILITY_PRESETS[preset_name]
+    last = max(1, length - 1)  # Ramps span the whole pattern; avoid /0 for length 1
+    return tuple(value_at(i, last) for i in range(length))
+
+
+def _probability_scaled(base: float, spread: float, step_prob: float, jitter: float,
+                        rand: Callable[[], float]) -> float:
+    """Scale a value around ``base`` by step probability plus some jitter.
+    
+    Higher probabilities land nearer the top of ``base +/- spread/2``, and
+    get more random jitter (drawn from -jitter..jitter, scaled by step_prob).
+    ``rand`` returns uniform floats in [0, 1).
+    """
+    factor = 0.5 + step_prob * 0.5 + (jitter * (2.0 * rand() - 1.0)) * step_prob
+    factor = max(0.1, min(1.0, factor))
+    return base + spread * (factor - 0.5)
+
+
+@dataclass(frozen=True, slots=True)
 class TickEvent:
     """Represents a sequencer tick."""
     step: int  # 0-based step number
@@ -25,7 +132,7 @@ class TickEvent:
     swing_adjusted: bool = False
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class NoteEvent:
     """Represents a note to be played."""
     note: int  # MIDI note number
@@ -39,6 +146,8 @@ class HighResClock:
     """High-resolution clock with drift correction.
     
     Provides accurate timing for sequencer steps with swing support.
+    The timing thread only stamps ticks and hands them to a dispatch
+    thread, so a slow tick callback cannot push later ticks off schedule.
     """
     
     def __init__(self, bpm: float = 110.0, ppq: int = 24, swing: float = 0.0):
@@ -47,10 +156,72 @@ class HighResClock:
         self.swing = swing
         self._running = False
         self._thread: Optional[threading.Thread] = None
+        self._dispatch_thread: Optional[threading.Thread] = None
+        self._tick_q: Optional[queue.SimpleQueue] = None
         self._tick_callback: Optional[Callable[[TickEvent], None]] = None
-        self._start_time = 0.0
+        self._next_tick_time = 0.0  # perf_counter() deadline of the next unswung tick
         self._tick_count = 0
-        self._drift_accumulator = 0.0
+        self._cpu: Optional[int] = None
+        self._rt_priority: Optional[int] = None
+        self._timing_path: Optional[str] = None
+        self._refresh_timing()
+    
+    @property
+    def tick_interval(self) -> float:
+        """Seconds between unswung ticks at the current bpm."""
+        return self._tick_interval
+    
+    def _refresh_timing(self):
+        """Recompute the values the clock thread derives from bpm/ppq/swing.
+        
+        Called whenever they change (see update_params), so the tick loop
+        only reads precomputed values.
+        """
+        self._tick_interval = 60.0 / (self.bpm * self.ppq)
+        self._swing_offset = self._tick_interval * self.swing
+        # Swing delays every other run of ppq/4 ticks (the off-beat 16ths).
+        # One cycle of per-tick offsets, indexed by tick count modulo its length.
+        swing_every = self.ppq // 4 if self.swing > 0.0 and self.ppq >= 4 else 0
+        if swing_every:
+            self._swing_offsets = (0.0,) * swing_every + (self._swing_offset,) * swing_every
+        else:
+            self._swing_offsets = (0.0,)
+    
+    def set_thread_scheduling(self, cpu: Optional[int] = None, rt_priority: Optional[int] = None):
+        """Pin the clock thread to a CPU and/or run it under SCHED_FIFO.
+        
+        Applied when the clock thread starts. Both are best effort: on
+        platforms without support, or without permission, the clock runs
+        with normal scheduling and a warning is logged.
+        """
+        self._cpu = cpu
+        self._rt_priority = rt_priority
+    
+    def _apply_thread_scheduling(self):
+        """Apply CPU affinity and real-time priority to the calling thread."""
+        # On Linux, pid 0 refers to the calling thread for both calls
+        if self._cpu is not None:
+            try:
+                os.sched_setaffinity(0, {self._cpu})
+                log.info(f"clock_thread_pinned cpu={self._cpu}")
+            except (AttributeError, OSError) as e:
+                log.warning(f"clock_thread_pin_failed cpu={self._cpu} error={e}")
+        if self._rt_priority is not None:
+            try:
+                os.sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(self._rt_priority))
+                log.info(f"clock_thread_realtime priority={self._rt_priority}")
+            except (AttributeError, OSError) as e:
+                log.warning(f"clock_thread_realtime_failed priority={self._rt_priority} error={e}")
+    
+    def set_timing_file(self, path: Optional[str]):
+        """Record every tick's deadline and actual time to a binary file.
+        
+        Takes effect the next time the clock starts; None turns recording
+        off. Records are TIMING_RECORD structs appended to the file through
+        a large write buffer, so recording barely changes the timing it
+        measures. debug/decode_clock_timing.py summarizes a recording.
+        """
+        self._timing_path = path
     
     def set_tick_callback(self, callback: Callable[[TickEvent], None]):
         """Set the callback for tick events."""
@@ -62,10 +233,14 @@ class HighResClock:
             return
         
         self._running = True
-        self._start_time = time.perf_counter()
+        self._next_tick_time = time.perf_counter()
         self._tick_count = 0
-        self._drift_accumulator = 0.0
         
+        self._tick_q = queue.SimpleQueue()
+        self._dispatch_thread = threading.Thread(
+            target=self._dispatch_loop, args=(self._tick_q,), name="clock-dispatch", daemon=True
+        )
+        self._dispatch_thread.start()
         self._thread = threading.Thread(target=self._clock_thread, daemon=True)
         self._thread.start()
         log.info(f"clock_started bpm={self.bpm} ppq={self.ppq} swing={self.swing}")
@@ -78,6 +253,13 @@ class HighResClock:
         self._running = False
         if self._thread:
             self._thread.join(timeout=1.0)
+        if self._tick_q is not None:
+            self._tick_q.put(None)
+            self._tick_q = None
+        # stop() may be called from inside a tick callback, i.e. on the
+        # dispatch thread itself, which must not join itself
+        if self._dispatch_thread and self._dispatch_thread is not threading.current_thread():
+            self._dispatch_thread.join(timeout=1.0)
         log.info("clock_stopped")
     
     def update_params(self, bpm: Optional[float] = None, swing: Optional[float] = None):
@@ -86,55 +268,92 @@ class HighResClock:
             self.bpm = bpm
         if swing is not None:
             self.swing = swing
-        log.debug(f"clock_params_updated bpm={self.bpm} swing={self.swing}")
+        self._refresh_timing()
+        log.debug("clock_params_updated bpm=%s swing=%s", self.bpm, self.swing)
     
     def _clock_thread(self):
-        """Main clock thread with drift correction."""
+        """Main clock thread: apply scheduling, then run the tick loop."""
+        self._apply_thread_scheduling()
+        timing_file = None
+        if self._timing_path:
+            try:
+                timing_file = open(self._timing_path, 'wb', buffering=_TIMING_BUFFER_BYTES)
+                log.info(f"clock_timing_recording path={self._timing_path}")
+            except OSError as e:
+                log.warning(f"clock_timing_open_failed path={self._timing_path} error={e}")
+        try:
+            self._run_ticks(timing_file)
+        finally:
+            if timing_file is not None:
+                timing_file.close()
+    
+    def _run_ticks(self, timing_file):
+        """Tick loop of the clock thread, optionally recording tick timing.
+        
+        Each tick's deadline is the previous one plus the current tick
+        interval, so timing never drifts and a tempo change only affects
+        ticks after it (rather than moving the whole schedule).
+        """
+        perf_counter = time.perf_counter
+        pack_timing = TIMING_RECORD.pack
+        
         while self._running:
-            tick_interval = 60.0 / (self.bpm * self.ppq)
-            
-            # Calculate target time for this tick
-            target_time = self._start_time + (self._tick_count * tick_interval)
-            
-            # Apply swing to odd-numbered 16th note ticks
-            # Swing affects every other ppq/4 tick (assuming ppq=24, every 6th tick)
-            swing_adjusted = False
-            if self.swing > 0.0 and self.ppq >= 4:
-                swing_tick_interval = self.ppq // 4
-                if swing_tick_interval > 0 and (self._tick_count // swing_tick_interval) % 2 == 1:
-                    swing_offset = tick_interval * self.swing
-                    target_time += swing_offset
-                    swing_adjusted = True
+            tick_interval = self._tick_interval
+            swing_offsets = self._swing_offsets
             
-            # Add accumulated drift compensation
-            target_time += self._drift_accumulator
-            
-            # Sleep until target time
-            current_time = time.perf_counter()
-            sleep_time = target_time - current_time
+            # Calculate target time for this tick, delayed on swung 16ths
+            swing_offset = swing_offsets[self._tick_count % len(swing_offsets)]
+            target_time = self._next_tick_time + swing_offset
+            swing_adjusted = swing_offset > 0.0
             
+            # Sleep until target time; the last clock read is the tick's timestamp
+            actual_time = perf_counter()
+            sleep_time = target_time - actual_time
             if sleep_time > 0:
-                time.sleep(sleep_time)
-            else:
-                # We're behind - accumulate the drift
-                self._drift_accumulator += sleep_time
-                # Limit drift accumulation to prevent runaway
-                self._drift_accumulator = max(-0.01, min(0.01, self._drift_accumulator))
+                # sleep() tends to wake late, so sleep most of the way and
+                # spin on perf_counter for the final stretch
+                if sleep_time > _SPIN_WINDOW_S:
+                    time.sleep(sleep_time - _SPIN_WINDOW_S)
+                while (actual_time := perf_counter()) < target_time:
+                    pass
             
-            # Emit tick event
+            if timing_file is not None:
+                timing_file.write(pack_timing(self._tick_count, target_time, actual_time))
+            
+            # Hand the tick to the dispatch thread; the callback runs there
             if self._tick_callback:
-                actual_time = time.perf_counter()
                 tick_event = TickEvent(
                     step=self._tick_count % self.ppq,
                     timestamp=actual_time,
                     swing_adjusted=swing_adjusted
                 )
-                try:
-                    self._tick_callback(tick_event)
-                except Exception as e:
-                    log.error(f"Tick callback error: {e}")
+                tick_q = self._tick_q
+                if tick_q is not None:
+                    tick_q.put(tick_event)
             
             self._tick_count += 1
+            self._next_tick_time += tick_interval
+            
+            # Catch up on a short delay, but don't burst through a long one
+            behind = actual_time - self._next_tick_time
+            if behind > _MAX_CATCH_UP_TICKS * tick_interval:
+                log.warning(f"clock_fell_behind ticks={int(behind / tick_interval)}")
+                self._next_tick_time = actual_time
+    
+    def _dispatch_loop(self, tick_q: queue.SimpleQueue):
+        """Run the tick callback for each tick queued by the clock thread."""
+        while True:
+            tick_event = tick_q.get()
+            if tick_event is None:
+                return
+            callback = self._tick_callback
+            if callback is None or not self._running:
+                # Ticks still queued when the clock stopped are dropped
+                continue
+            try:
+                callback(tick_event)
+            except Exception as e:
+                log.error(f"Tick callback error: {e}")
 
 
 class Sequencer:
@@ -144,21 +363,38 @@ class Sequencer:
     Phase 5.5: Enhanced with direction patterns, per-step probability, and velocity variation.
     """
     
-    def __init__(self, state: State, scales: List[str]):
+    def __init__(self, state: State, scales: List[str], seed: Optional[int] = None):
         self.state = state
         self.available_scales = scales
         self.scale_mapper = ScaleMapper()
         self.clock = HighResClock()
+        # Sequencer-local RNG; pass a seed for reproducible gates and patterns
+        self._rng = random.Random(os.urandom(8) if seed is None else seed)
         self._note_callback: Optional[Callable[[NoteEvent], None]] = None
         self._current_step = 0
         self._steps_per_beat = 4  # 16th notes
         self._ticks_per_step = 0
         self._tick_counter = 0
         
+        # Step parameters read on every step, kept current by _on_state_change
+        self._sequence_length, self._direction_pattern = state.get_many(
+            {'sequence_length': 8, 'direction_pattern': 'forward'}
+        )
+        
         # Direction pattern state
         self._direction = 1  # 1 for forward, -1 for backward
         self._ping_pong_direction = 1  # For ping-pong mode
         
+        # Steps whose tick was handled too late to play (see _advance_step)
+        self._dropped_steps = 0
+        
+        # Recent note callback failures as (exception type, message)
+        self._callback_errors: deque = deque(maxlen=16)
+        
+        # Set by start_note_dispatcher(); None means notes are delivered inline
+        self._note_q: Optional[queue.SimpleQueue] = None
+        self._note_thread: Optional[threading.Thread] = None
+        
         # For quantizing scale changes
         self._pending_scale_index: Optional[int] = None
         self._quantize_on_bar = True # From config eventually
@@ -170,11 +406,22 @@ class Sequencer:
         self._bpm_transition_start_bpm = 0.0
         self._bpm_transition_target_bpm = 0.0
 
-        # Listen for state changes
+        # Listen for state changes; parameters without a handler are ignored
+        self._state_handlers: Dict[str, Callable[[StateChange], None]] = {
+            BATCH_PARAMETER: self._on_state_batch,
+            'bpm': self._on_bpm_change,
+            'swing': self._on_swing_change,
+            'scale_index': self._on_scale_change,
+            'root_note': self._on_scale_change,
+            'sequence_length': self._on_sequence_length_change,
+            'step_position': self._on_step_position_change,
+            'direction_pattern': self._on_direction_pattern_change,
+        }
         self.state.add_listener(self._on_state_change)
         
         # Initialize clock and scale from state
         self._update_clock_from_state()
+        self._update_step_duration()
         self._update_scale_from_state(force=True)  # Force immediate application during init
         
         # Set up clock callback
@@ -315,7 +562,7 @@ class Sequencer:
             # Update clock directly (don't trigger state change to avoid recursion)
             self.clock.update_params(bpm=current_bpm)
             
-            log.debug(f"bpm_transition_update progress={progress:.3f} bpm={current_bpm:.1f}")
+            log.debug("bpm_transition_update progress=%.3f bpm=%.1f", progress, current_bpm)
     
     
     def get_pattern_preset(self, preset_name: str) -> List[bool]:
@@ -327,22 +574,11 @@ class Sequencer:
         Returns:
             List of boolean values for the pattern
         """
-        presets = {
-            'four_on_floor': [True, False, False, False, True, False, False, False],
-            'offbeat': [False, True, False, True, False, True, False, True],
-            'every_other': [True, False, True, False, True, False, True, False],
-            'syncopated': [True, False, True, True, False, True, False, False],
-            'dense': [True, True, False, True, True, False, True, True],
-            'sparse': [True, False, False, False, False, False, True, False],
-            'all_on': [True] * 8,
-            'all_off': [False] * 8
-        }
-        
-        if preset_name in presets:
-            return presets[preset_name]
-        else:
+        preset = _PATTERN_PRESETS.get(preset_name)
+        if preset is None:
             log.warning(f"Unknown pattern preset: {preset_name}, using 'every_other'")
-            return presets['every_other']
+            preset = _PATTERN_PRESETS['every_other']
+        return list(preset)
     
     def get_probability_preset(self, preset_name: str, length: int = 8) -> List[float]:
         """Get a predefined probability pattern.
@@ -354,22 +590,15 @@ class Sequencer:
         Returns:
             List of probability values
         """
-        presets = {
-            'uniform': [0.9] * length,
-            'crescendo': [0.3 + (i * 0.6 / (length - 1)) for i in range(length)],
-            'diminuendo': [0.9 - (i * 0.6 / (length - 1)) for i in range(length)],
-            'peaks': [0.9 if i % 4 == 0 else 0.4 for i in range(length)],
-            'valleys': [0.3 if i % 4 == 0 else 0.8 for i in range(length)],
-            'random_low': [random.uniform(0.2, 0.6) for _ in range(length)],
-            'random_high': [random.uniform(0.6, 1.0) for _ in range(length)],
-            'alternating': [0.9 if i % 2 == 0 else 0.3 for i in range(length)]
-        }
+        random_range = _RANDOM_PROBABILITY_PRESETS.get(preset_name)
+        if random_range is not None:
+            uniform = self._rng.uniform
+            return [uniform(*random_range) for _ in range(length)]
         
-        if preset_name in presets:
-            return presets[preset_name]
-        else:
+        if preset_name not in _PROBABILITY_PRESETS:
             log.warning(f"Unknown probability preset: {preset_name}, using 'uniform'")
-            return presets['uniform']
+            preset_name = 'uniform'
+        return list(_probability_preset(preset_name, length))
     
     def get_direction_preset(self, preset_name: str) -> str:
         """Get a direction pattern preset name.
@@ -426,7 +655,7 @@ class Sequencer:
         Returns:
             Next step position (0-based)
         """
-        direction_pattern = self.state.get('direction_pattern', 'forward')
+        direction_pattern = self._direction_pattern
         
         if direction_pattern == 'forward':
             return (current_step + 1) % sequence_length
@@ -436,26 +665,26 @@ class Sequencer:
         
         elif direction_pattern == 'ping_pong':
             # Ping-pong bounces at sequence boundaries
-            next_step = current_step + self._ping_pong_direction
-            
-            # Check for boundaries and reverse direction
-            if next_step >= sequence_length:
-                self._ping_pong_direction = -1
-                next_step = sequence_length - 2  # Bounce back
-            elif next_step < 0:
-                self._ping_pong_direction = 1
-                next_step = 1  # Bounce forward
-            
-            return max(0, min(sequence_length - 1, next_step))
+            if 0 <= current_step < sequence_length:
+                table = _ping_pong_table(sequence_length)[self._ping_pong_direction > 0]
+                next_step, self._ping_pong_direction = table[current_step]
+            else:
+                # Step left over from a longer sequence
+                next_step, self._ping_pong_direction = _ping_pong_move(
+                    current_step, self._ping_pong_direction, sequence_length
+                )
+            return next_step
         
         elif direction_pattern == 'random':
             # Choose a random step, but avoid staying on the same step
-            possible_steps = [i for i in range(sequence_length) if i != current_step]
-            if possible_steps:
-                return random.choice(possible_steps)
-            else:
-                # Fallback if sequence length is 1
-                return current_step
+            if sequence_length <= 1:
+                # Only step 0 exists
+                return 0
+            if not 0 <= current_step < sequence_length:
+                return self._rng.randrange(sequence_length)
+            # Draw from the other steps by skipping over the current one
+            next_step = self._rng.randrange(sequence_length - 1)
+            return next_step + 1 if next_step >= current_step else next_step
         
         else:
             # Fallback to forward
@@ -478,6 +707,54 @@ class Sequencer:
         self.clock.stop()
         log.info("sequencer_stopped")
     
+    def start_note_dispatcher(self):
+        """Deliver note events from a background thread.
+        
+        The note callback usually does MIDI or network I/O; run off the
+        tick path, a slow send no longer holds up the next step.
+        """
+        if self._note_q is not None:
+            return
+        self._note_q = queue.SimpleQueue()
+        self._note_thread = threading.Thread(
+            target=self._note_dispatch_loop, args=(self._note_q,),
+            name="note-dispatch", daemon=True
+        )
+        self._note_thread.start()
+        log.info("note_dispatcher_started")
+    
+    def stop_note_dispatcher(self, timeout: float = 1.0):
+        """Drain queued note events and return to inline delivery."""
+        note_q = self._note_q
+        if note_q is None:
+            return
+        self._note_q = None
+        note_q.put(None)
+        self._note_thread.join(timeout)
+        log.info("note_dispatcher_stopped")
+    
+    def _note_dispatch_loop(self, note_q: queue.SimpleQueue):
+        """Background loop delivering queued note events to the callback."""
+        while True:
+            note_event = note_q.get()
+            if note_event is None:
+                return
+            self._deliver_note(note_event)
+    
+    def _deliver_note(self, note_event: NoteEvent):
+        """Call the note callback with a note event."""
+        callback = self._note_callback
+        if callback is None:
+            return
+        try:
+            callback(note_event)
+        except Exception as e:
+            self._note_callback_failed(e)
+    
+    def _update_step_duration(self):
+        """Cache the length of one step at the state's bpm (used for gate lengths)."""
+        self._step_duration = 60.0 / (self.state.get('bpm', 110.0) * self._steps_per_beat)
+    
     def _update_clock_from_state(self):
         """Update clock parameters from current state."""
         bpm = self.state.get('bpm', 110.0)
@@ -512,43 +789,87 @@ class Sequencer:
         else:
             log.warning(f"Invalid scale_index {scale_index}, max is {len(self.available_scales)-1}")
         self._pending_scale_index = None
+        self._build_step_notes()
+
+    def _build_step_notes(self):
+        """Precompute the note each step plays under the current scale.
+
+        Steps map to scale degrees two at a time (degree = step // 2).
+        """
+        get_note = self.scale_mapper.get_note
+        self._step_notes = tuple(get_note(step // 2, octave=0) for step in range(_MAX_STEPS))
 
     def _on_state_change(self, change: StateChange):
         """Handle state parameter changes."""
-        if change.parameter == 'bpm':
-            # Handle BPM changes based on source
-            if change.source == 'idle' and self.state.get('smooth_idle_transitions', True):
-                # Smooth transition for idle mode changes
-                current_bpm = change.old_value if change.old_value is not None else 110.0
-                target_bpm = change.new_value
-                transition_duration = self.state.get('idle_transition_duration_s', 4.0)
-                self.start_bpm_transition(current_bpm, target_bpm, transition_duration)
-            elif change.source not in ('sequencer_transition_complete', 'sequencer_immediate'):
-                # Immediate change for MIDI/user input (cancel any active transition)
-                self._bpm_transition_active = False
-                self._update_clock_from_state()
-            # Otherwise ignore (transition is handling it)
-        elif change.parameter == 'swing':
+        handler = self._state_handlers.get(change.parameter)
+        if handler is not None:
+            handler(change)
+    
+    def _on_bpm_change(self, change: StateChange):
+        """Follow a bpm change, smoothly for idle changes and immediately otherwise."""
+        self._update_step_duration()
+        # Handle BPM changes based on source
+        if change.source == 'idle' and self.state.get('smooth_idle_transitions', True):
+            # Smooth transition for idle mode changes
+            current_bpm = change.old_value if change.old_value is not None else 110.0
+            target_bpm = change.new_value
+            transition_duration = self.state.get('idle_transition_duration_s', 4.0)
+            self.start_bpm_transition(current_bpm, target_bpm, transition_duration)
+        elif change.source not in ('sequencer_transition_complete', 'sequencer_immediate'):
+            # Immediate change for MIDI/user input (cancel any active transition)
+            self._bpm_transition_active = False
             self._update_clock_from_state()
-        elif change.parameter in ('scale_index', 'root_note'):
+        # Otherwise ignore (transition is handling it)
+    
+    def _on_swing_change(self, change: StateChange):
+        self._update_clock_from_state()
+    
+    def _on_scale_change(self, change: StateChange):
+        self._update_scale_from_state()
+    
+    def _on_sequence_length_change(self, change: StateChange):
+        self._sequence_length = change.new_value
+        log.debug(f"sequence_length_changed new_length={change.new_value}")
+    
+    def _on_step_position_change(self, change: StateChange):
+        self._current_step = change.new_value
+    
+    def _on_direction_pattern_change(self, change: StateChange):
+        """Reset direction state when the pattern changes."""
+        direction = change.new_value
+        self._direction_pattern = direction
+        if direction == 'forward':
+            self._direction = 1
+            self._ping_pong_direction = 1
+        elif direction == 'backward':
+            self._direction = -1
+            self._ping_pong_direction = -1
+        elif direction == 'ping_pong':
+            self._direction = 1
+            self._ping_pong_direction = 1
+        log.debug(f"direction_pattern_changed pattern={direction}")
+    
+    def _on_state_batch(self, batch: StateChange):
+        """Handle a coalesced update_multiple() change.
+        
+        Each parameter is handled as if it changed on its own, except that
+        the scale is refreshed once however many scale parameters changed.
+        """
+        old_values = batch.old_value
+        scale_changed = False
+        for param, new_value in batch.new_value.items():
+            if param in ('scale_index', 'root_note'):
+                scale_changed = True
+                continue
+            self._on_state_change(StateChange(
+                parameter=param,
+                old_value=old_values.get(param),
+                new_value=new_value,
+                timestamp=batch.timestamp,
+                source=batch.source
+            ))
+        if scale_changed:
             self._update_scale_from_state()
-        elif change.parameter == 'sequence_length':
-            log.debug(f"sequence_length_changed new_length={change.new_value}")
-        elif change.parameter == 'step_position':
-            self._current_step = change.new_value
-        elif change.parameter == 'direction_pattern':
-            # Reset direction state when pattern changes
-            direction = change.new_value
-            if direction == 'forward':
-                self._direction = 1
-                self._ping_pong_direction = 1
-            elif direction == 'backward':
-                self._direction = -1
-                self._ping_pong_direction = -1
-            elif direction == 'ping_pong':
-                self._direction = 1
-                self._ping_pong_direction = 1
-            log.debug(f"direction_pattern_changed pattern={direction}")
     
     def _on_tick(self, tick: TickEvent):
         """Handle clock tick events."""
@@ -559,11 +880,17 @@ class Sequencer:
         
         if self._tick_counter >= self._ticks_per_step:
             self._tick_counter = 0
-            self._advance_step()
+            self._advance_step(tick)
     
-    def _advance_step(self):
-        """Advance to the next step using the current direction pattern and generate events."""
-        sequence_length = self.state.get('sequence_length', 8)
+    def _advance_step(self, tick: Optional[TickEvent] = None):
+        """Advance to the next step using the current direction pattern and generate events.
+        
+        If the tick that triggered this step is already a whole step old
+        (the tick callback fell behind), the step position still advances
+        so the sequence stays aligned with the clock, but its note is
+        dropped rather than played late in a catch-up burst.
+        """
+        sequence_length = self._sequence_length
         
         # Calculate next step using direction pattern
         next_step = self._get_next_step(self._current_step, sequence_length)
@@ -574,12 +901,20 @@ class Sequencer:
         if is_bar_boundary and self._pending_scale_index is not None:
             self._apply_scale_change(self._pending_scale_index)
         
-        self.state.set('step_position', self._current_step, source='sequencer')
+        # Published for polling only; listeners (including our own) don't need each step
+        self.state.set('step_position', self._current_step, source='sequencer', notify=False)
+        
+        if tick is not None:
+            step_interval = self._ticks_per_step * self.clock.tick_interval
+            if time.perf_counter() - tick.timestamp > step_interval:
+                self._dropped_steps += 1
+                log.warning(f"step_dropped step={self._current_step} dropped_steps={self._dropped_steps}")
+                return
         
         self._generate_step_note(self._current_step)
         
-        direction_pattern = self.state.get('direction_pattern', 'forward')
-        log.debug(f"step_advance step={self._current_step} length={sequence_length} direction={direction_pattern}")
+        log.debug("step_advance step=%s length=%s direction=%s",
+                  self._current_step, sequence_length, self._direction_pattern)
     
     def _generate_step_note(self, step: int):
         """
@@ -589,67 +924,51 @@ class Sequencer:
         if not self._note_callback:
             return
 
-        density = self.state.get('density', 0.85)
+        # One lock acquisition for everything this step needs
+        (density, step_probabilities, note_prob, step_pattern,
+         base_velocity, velocity_range, base_gate_length,
+         gate_length_range) = self.state.get_many(_NOTE_PARAMS)
+
+        rand = self._rng.random
 
         # Density acts as a gate for the entire step's activity
-        if random.random() > density:
+        if rand() > density:
             return
 
         # Phase 5.5: Get per-step probability array
-        step_probabilities = self.state.get('step_probabilities', None)
         if step_probabilities is None:
             # Fallback to global note_probability for backward compatibility
-            note_prob = self.state.get('note_probability', 0.9)
-            step_probabilities = [note_prob] * self.state.get('sequence_length', 8)
-        
-        # Get probability for this specific step
-        sequence_length = len(step_probabilities)
-        step_prob = step_probabilities[step % sequence_length]
+            step_prob = note_prob
+        else:
+            # Get probability for this specific step
+            step_prob = step_probabilities[step % len(step_probabilities)]
 
         # Phase 5.5: Get configurable step pattern
-        step_pattern = self.state.get('step_pattern', None)
         if step_pattern is None:
             # Fallback to hardcoded even-step pattern for backward compatibility
-            is_active_step = step % 2 == 0
+            is_active_step = not step & 1
         else:
             # Use configurable pattern (array of booleans)
             pattern_length = len(step_pattern)
             is_active_step = step_pattern[step % pattern_length]
         
-        if is_active_step and random.random() < step_prob:
-            # Use scale mapper to get the note
+        if is_active_step and rand() < step_prob:
             # Simple mapping: step number maps to scale degree
-            degree = step // 2 
-            note = self.scale_mapper.get_note(degree, octave=0)
+            step_notes = self._step_notes
+            if step < len(step_notes):
+                note = step_notes[step]
+            else:
+                # step_position was set past the longest sequence
+                note = self.scale_mapper.get_note(step // 2, octave=0)
             
             # Phase 5.5: Velocity variation based on probability values
-            base_velocity = self.state.get('base_velocity', 80)
-            velocity_range = self.state.get('velocity_range', 40)  # +/- range
-            
-            # Scale velocity based on step probability (higher prob = higher velocity)
-            # Also add some randomness based on the probability
-            velocity_factor = 0.5 + (step_prob * 0.5)  # 0.5 to 1.0 range
-            velocity_random = random.uniform(-0.2, 0.2) * step_prob  # More randomness for higher probs
-            
-            final_velocity_factor = max(0.1, min(1.0, velocity_factor + velocity_random))
-            velocity = int(base_velocity + (velocity_range * (final_velocity_factor - 0.5)))
+            # (higher prob = higher velocity, with more randomness)
+            velocity = int(_probability_scaled(base_velocity, velocity_range, step_prob, 0.2, rand))
             velocity = max(1, min(127, velocity))  # Clamp to MIDI range
             
             # Gate length variation based on probability values (similar to velocity)
-            bpm = self.state.get('bpm', 110.0)
-            step_duration = 60.0 / (bpm * self._steps_per_beat)
-            
-            # Use configurable gate length parameters with variation
-            base_gate_length = self.state.get('base_gate_length', 0.8)
-            gate_length_range = self.state.get('gate_length_range', 0.3)  # +/- range
-            
-            # Scale gate length based on step probability (higher prob = longer gate)
-            # Also add some randomness based on the probability
-            gate_factor = 0.5 + (step_prob * 0.5)  # 0.5 to 1.0 range
-            gate_random = random.uniform(-0.15, 0.15) * step_prob  # Subtle randomness for higher probs
-            
-            final_gate_factor = max(0.1, min(1.0, gate_factor + gate_random))
-            gate_length_factor = base_gate_length + (gate_length_range * (final_gate_factor - 0.5))
+            step_duration = self._step_duration
+            gate_length_factor = _probability_scaled(base_gate_length, gate_length_range, step_prob, 0.15, rand)
             gate_length_factor = max(0.1, min(1.0, gate_length_factor))  # Clamp to valid range
             
             gate_length = step_duration * gate_length_factor
@@ -662,13 +981,27 @@ class Sequencer:
                 duration=gate_length
             )
             
-            try:
-                self._note_callback(note_event)
-                log.debug(f"note_generated step={step} note={note} velocity={velocity} gate_length={gate_length:.3f} step_prob={step_prob:.2f}")
-            except Exception as e:
-                log.error(f"Note callback error: {e}")
+            note_q = self._note_q
+            if note_q is not None:
+                note_q.put(note_event)
+            else:
+                self._deliver_note(note_event)
+            log.debug("note_generated step=%s note=%s velocity=%s gate_length=%.3f step_prob=%.2f",
+                      step, note, velocity, gate_length, step_prob)
+    
+    def _note_callback_failed(self, e: Exception):
+        """Record a note callback failure, logging it unless it repeats the last one.
+        
+        A broken callback fails on every step; logging each one would put
+        handler I/O on the tick path at step rate.
+        """
+        error = (type(e).__name__, str(e))
+        errors = self._callback_errors
+        if not errors or errors[-1] != error:
+            log.error(f"Note callback error: {e}")
+        errors.append(error)
 
 
-def create_sequencer(state: State, scales: list[str]) -> Sequencer:
+def create_sequencer(state: State, scales: list[str], seed: Optional[int] = None) -> Sequencer:
     """Factory function to create a sequencer instance."""
-    return Sequencer(state, scales)
+    return Sequencer(state, scales, seed=seed)
@@ -8,11 +8,15 @@ from __future__ import annotations
 from typing import Dict, Any, Callable, List, Optional, Union
 from dataclasses import dataclass, field
 import logging
+import queue
 import threading
 import time
 
 log = logging.getLogger(__name__)
 
+# StateChange.parameter for a coalesced update_multiple() notification
+BATCH_PARAMETER = '__batch__'
+
 
 @dataclass
 class StateChange:
@@ -29,12 +33,20 @@ class State:
     
     Maintains core engine parameters like tempo, density, swing, etc.
     Provides validation and change listener support.
+    
+    Listeners are called synchronously by default. After start_dispatcher()
+    changes are queued and delivered from a background thread instead, so
+    writers never wait on listener work.
     """
     
     def __init__(self):
         self._params: Dict[str, Any] = {}
+        # Copy-on-write so the dispatcher can iterate without holding a lock
         self._listeners: List[Callable[[StateChange], None]] = []
+        self._listeners_lock = threading.Lock()
         self._lock = threading.RLock()
+        self._event_q: Optional[queue.SimpleQueue] = None
+        self._dispatch_thread: Optional[threading.Thread] = None
         
         # Initialize default parameters
         self._init_defaults()
@@ -70,23 +82,88 @@ class State:
     
     def add_listener(self, listener: Callable[[StateChange], None]):
         """Add a change listener."""
-        with self._lock:
-            self._listeners.append(listener)
+        with self._listeners_lock:
+            self._listeners = self._listeners + [listener]
     
     def remove_listener(self, listener: Callable[[StateChange], None]):
         """Remove a change listener."""
-        with self._lock:
+        with self._listeners_lock:
             if listener in self._listeners:
-                self._listeners.remove(listener)
+                self._listeners = [l for l in self._listeners if l is not listener]
+    
+    def start_dispatcher(self):
+        """Deliver change notifications from a background thread."""
+        with self._lock:
+            if self._event_q is not None:
+                return
+            self._event_q = queue.SimpleQueue()
+            self._dispatch_thread = threading.Thread(
+                target=self._dispatch_loop, args=(self._event_q,),
+                name="state-dispatch", daemon=True
+            )
+            self._dispatch_thread.start()
+        log.info("state_dispatcher_started")
+    
+    def stop_dispatcher(self, timeout: float = 1.0):
+        """Drain queued notifications and return to synchronous delivery."""
+        with self._lock:
+            event_q = self._event_q
+            if event_q is None:
+                return
+            self._event_q = None
+            event_q.put(None)
+        self._dispatch_thread.join(timeout)
+        log.info("state_dispatcher_stopped")
+    
+    def flush_events(self, timeout: float = 1.0) -> bool:
+        """Wait until all queued notifications have been delivered.
+        
+        Returns False if the queue did not drain within the timeout.
+        """
+        event_q = self._event_q
+        if event_q is None or threading.current_thread() is self._dispatch_thread:
+            return True
+        marker = threading.Event()
+        event_q.put(marker)
+        return marker.wait(timeout)
+    
+    def _dispatch_loop(self, event_q: queue.SimpleQueue):
+        """Background loop delivering queued changes to listeners."""
+        while True:
+            item = event_q.get()
+            if item is None:
+                break
+            if isinstance(item, threading.Event):
+                item.set()
+                continue
+            self._deliver(item)
     
     def get(self, param: str, default: Any = None) -> Any:
-        """Get a parameter value."""
+        """Get a parameter value.
+        
+        Lock-free: writers replace values with a single dict store, which
+        is atomic in CPython, so a reader always sees a whole old or new
+        value and never waits behind a writer or its listeners. Use
+        get_many() when several values must come from the same update.
+        """
+        return self._params.get(param, default)
+    
+    def get_many(self, defaults: Dict[str, Any]) -> tuple:
+        """Get several parameter values under a single lock acquisition.
+        
+        Takes a mapping of parameter name to default and returns the values
+        as a tuple in the same order.
+        """
         with self._lock:
-            return self._params.get(param, default)
+            params = self._params
+            return tuple(params.get(param, default) for param, default in defaults.items())
     
-    def set(self, param: str, value: Any, source: str = "unknown") -> bool:
+    def set(self, param: str, value: Any, source: str = "unknown", notify: bool = True) -> bool:
         """Set a parameter value with validation.
         
+        With notify=False listeners are not told about the change; for
+        values written at step rate that readers poll with get().
+        
         Returns True if value was changed, False if unchanged or invalid.
         """
         # Validate and clamp value
@@ -103,32 +180,83 @@ class State:
             self._params[param] = validated_value
             
             # Notify listeners
-            change = StateChange(
-                parameter=param,
-                old_value=old_value,
-                new_value=validated_value,
-                source=source
-            )
+            if notify:
+                change = StateChange(
+                    parameter=param,
+                    old_value=old_value,
+                    new_value=validated_value,
+                    source=source
+                )
+                self._notify_listeners(change)
             
-            for listener in self._listeners:
-                try:
-                    listener(change)
-                except Exception as e:
-                    log.error(f"State listener error: {e}")
-            
-            log.debug(f"state_change param={param} old={old_value} new={validated_value} source={source}")
+            log.debug("state_change param=%s old=%s new=%s source=%s", param, old_value, validated_value, source)
             return True
     
-    def update_multiple(self, updates: Dict[str, Any], source: str = "unknown") -> int:
+    def update_multiple(self, updates: Dict[str, Any], source: str = "unknown",
+                        overwrite: bool = True, coalesce: bool = False) -> int:
         """Update multiple parameters atomically.
         
+        All values are applied under a single lock acquisition before listeners
+        are notified. With overwrite=False, parameters that already have a
+        value are left untouched (useful for registering defaults).
+        
+        With coalesce=True listeners get one StateChange whose parameter is
+        BATCH_PARAMETER and whose old_value/new_value are dicts of the
+        changed parameters, instead of one change per parameter.
+        
         Returns count of parameters that were actually changed.
         """
-        changes = 0
-        for param, value in updates.items():
-            if self.set(param, value, source):
-                changes += 1
-        return changes
+        changes: List[StateChange] = []
+        with self._lock:
+            for param, value in updates.items():
+                old_value = self._params.get(param)
+                if not overwrite and old_value is not None:
+                    continue
+                
+                validated_value = self._validate_param(param, value)
+                if validated_value is None:
+                    log.warning(f"Invalid value for parameter {param}: {value}")
+                    continue
+                if old_value == validated_value:
+                    continue
+                
+                self._params[param] = validated_value
+                changes.append(StateChange(
+                    parameter=param,
+                    old_value=old_value,
+                    new_value=validated_value,
+                    source=source
+                ))
+            
+            if coalesce and changes:
+                self._notify_listeners(StateChange(
+                    parameter=BATCH_PARAMETER,
+                    old_value={c.parameter: c.old_value for c in changes},
+                    new_value={c.parameter: c.new_value for c in changes},
+                    source=source
+                ))
+            else:
+                for change in changes:
+                    self._notify_listeners(change)
+        
+        if changes:
+            log.debug(f"state_update_multiple count={len(changes)} source={source}")
+        return len(changes)
+    
+    def _notify_listeners(self, change: StateChange):
+        """Queue or deliver a change (caller holds the lock to keep ordering)."""
+        if self._event_q is not None:
+            self._event_q.put(change)
+        else:
+            self._deliver(change)
+    
+    def _deliver(self, change: StateChange):
+        """Call every listener with a change."""
+        for listener in self._listeners:
+            try:
+                listener(change)
+            except Exception as e:
+                log.error(f"State listener error: {e}")
     
     def get_all(self) -> Dict[str, Any]:
         """Get a copy of all parameters."""
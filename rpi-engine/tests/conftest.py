@@ -1,7 +1,19 @@
 import sys
 import pathlib
 
+import pytest
+
 # Ensure src directory is on path for tests
 SRC = pathlib.Path(__file__).resolve().parent.parent / "src"
 if str(SRC) not in sys.path:
     sys.path.insert(0, str(SRC))
+
+TEST_CONFIG = pathlib.Path(__file__).resolve().parent / "test.yaml"
+
+
+@pytest.fixture(scope="session")
+def cfg():
+    """tests/test.yaml loaded once per session; treat as read-only."""
+    from config import load_config
+
+    return load_config(str(TEST_CONFIG))
@@ -1,6 +1,7 @@
 """Integration tests for Phase 2 engine components."""
 
 import pytest
+import threading
 import time
 from unittest.mock import Mock, patch
 from mido import Message
@@ -59,8 +60,10 @@ def integrated_system(config):
     
     # Track generated notes
     generated_notes = []
+    note_generated = threading.Event()
     def note_callback(note_event):
         generated_notes.append(note_event)
+        note_generated.set()
     
     sequencer.set_note_callback(note_callback)
     action_handler.set_note_callback(note_callback)
@@ -79,6 +82,7 @@ def integrated_system(config):
         'action_handler': action_handler,
         'router': router,
         'generated_notes': generated_notes,
+        'note_generated': note_generated,
         'semantic_events': semantic_events,
     }
 
@@ -138,8 +142,8 @@ def test_sequencer_clock_integration(integrated_system):
     # Start sequencer
     system['sequencer'].start()
     
-    # Wait for some steps
-    time.sleep(0.2)
+    # Wait for the first note
+    system['note_generated'].wait(timeout=2.0)
     
     # Stop sequencer
     system['sequencer'].stop()
@@ -4,7 +4,6 @@ Tests for Phase 4 features: Scale mapping and probability.
 
 import pytest
 import time
-from unittest.mock import Mock, call
 
 from state import State, get_state, reset_state
 from sequencer import Sequencer, NoteEvent
@@ -38,6 +37,15 @@ def test_scale_mapper_pentatonic_minor():
     assert notes == expected_notes
 
 
+def test_scale_mapper_octave_wrapping():
+    mapper = ScaleMapper()
+    mapper.set_scale("pentatonic_minor", root_note=57)
+    assert mapper.get_note(-1) == 55  # G below the root
+    assert mapper.get_note(6, octave=1) == 84  # C two octaves up
+    mapper.set_scale("major", root_note=48)  # Table follows scale changes
+    assert mapper.get_note(2, octave=-1) == 40
+
+
 def test_sequencer_uses_scale_mapper():
     state = get_state()
     scales = ["pentatonic_minor"]
@@ -45,8 +53,8 @@ def test_sequencer_uses_scale_mapper():
     state.set('root_note', 57)  # A3 to match expected notes
     
     sequencer = Sequencer(state, scales)
-    mock_note_callback = Mock()
-    sequencer.set_note_callback(mock_note_callback)
+    notes = []
+    sequencer.set_note_callback(notes.append)
 
     # Force density and probability to 1.0 for deterministic test
     state.set('density', 1.0)
@@ -56,14 +64,13 @@ def test_sequencer_uses_scale_mapper():
     time.sleep(0.5)  # Let it run for a few steps
     sequencer.stop()
 
-    assert mock_note_callback.call_count > 0
+    assert len(notes) > 0
     
     # Expected notes from A minor pentatonic scale starting at A3 (root 57)
     # Sequencer plays on even steps (0, 2, 4, 6), mapping to degrees (0, 1, 2, 3)
     expected_notes = [57, 60, 62, 64] 
     
-    for i, mock_call in enumerate(mock_note_callback.call_args_list):
-        note_event: NoteEvent = mock_call.args[0]
+    for i, note_event in enumerate(notes):
         assert note_event.note == expected_notes[i]
 
 
@@ -71,8 +78,8 @@ def test_density_and_probability_gating():
     state = get_state()
     scales = ["major"]
     sequencer = Sequencer(state, scales)
-    mock_note_callback = Mock()
-    sequencer.set_note_callback(mock_note_callback)
+    notes = []
+    sequencer.set_note_callback(notes.append)
 
     # Test with zero density - no notes should be generated
     state.set('density', 0.0)
@@ -80,7 +87,7 @@ def test_density_and_probability_gating():
     sequencer.start()
     time.sleep(0.5)
     sequencer.stop()
-    mock_note_callback.assert_not_called()
+    assert notes == []
 
     # Test with zero probability - no notes should be generated
     state.set('density', 1.0)
@@ -88,7 +95,7 @@ def test_density_and_probability_gating():
     sequencer.start()
     time.sleep(0.5)
     sequencer.stop()
-    mock_note_callback.assert_not_called()
+    assert notes == []
 
 def test_quantized_scale_change():
     state = get_state()
@@ -0,0 +1,57 @@
+"""Tests for the key=value log formatter."""
+
+import logging
+from logging_utils import KeyValueFormatter
+
+
+def _record(msg, *args, extra=None, exc_info=None):
+    logger = logging.getLogger("test.kv")
+    return logger.makeRecord("test.kv", logging.INFO, __file__, 1, msg, args, exc_info, extra=extra)
+
+
+def test_format_basic_fields():
+    """Test the fixed fields of a formatted line."""
+    line = KeyValueFormatter().format(_record("note_generated step=%d", 3))
+    assert line.startswith("ts=")
+    assert " level=INFO logger=test.kv msg=\"note_generated step=3\"" in line
+
+
+def test_format_time_matches_base_formatter():
+    """Test that the cached timestamp matches logging.Formatter's."""
+    formatter = KeyValueFormatter()
+    reference = logging.Formatter()
+    reference.default_time_format = formatter.default_time_format
+    reference.default_msec_format = formatter.default_msec_format
+    record = _record("tick")
+    for created in (1755691201.25, 1755691201.999, 1755691202.004):
+        record.created = created
+        record.msecs = (created - int(created)) * 1000
+        assert formatter.formatTime(record) == reference.formatTime(record)
+    assert formatter.formatTime(record, "%H") == reference.formatTime(record, "%H")
+
+
+def test_format_extras_sorted_and_filtered():
+    """Test that extras are appended in key order and private ones skipped."""
+    line = KeyValueFormatter().format(_record("tick", extra={"zeta": 1, "alpha": "x y", "_hidden": 2}))
+    assert line.endswith("msg=tick alpha=\"x y\" zeta=1")
+    assert "_hidden" not in line
+
+
+def test_format_exception_marker():
+    """Test that records with exception info are flagged."""
+    try:
+        raise RuntimeError("boom")
+    except RuntimeError:
+        import sys
+        record = _record("failed", exc_info=sys.exc_info())
+    assert KeyValueFormatter().format(record).endswith(" exc=1")
+
+
+def test_escape_quotes_only_values_with_whitespace():
+    """Test value quoting rules."""
+    escape = KeyValueFormatter._escape
+    assert escape(42) == "42"
+    assert escape("bare") == "bare"
+    assert escape('say"hi"') == 'say"hi"'  # No whitespace, left as-is
+    assert escape('two "words"') == "\"two 'words'\""
+    assert escape("tab\there") == '"tab\there"'
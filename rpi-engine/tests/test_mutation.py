@@ -3,7 +3,9 @@
 Phase 5: Test mutation rule boundaries, weighted selection, and scheduling.
 """
 
+import dataclasses
 import pytest
+import random
 import time
 import threading
 from unittest.mock import MagicMock
@@ -59,6 +61,24 @@ class TestMutationRule:
         # Delta should be scaled: -5.0 to 5.0
         assert -5.0 <= delta <= 5.0
 
+    def test_apply_delta_with_rng(self):
+        """Test delta application with an explicit random generator."""
+        rule = MutationRule(parameter="density", delta_range=(-0.1, 0.1))
+
+        # Same seed should produce the same result
+        first = rule.apply_delta(0.5, random.Random(42))
+        second = rule.apply_delta(0.5, random.Random(42))
+        assert first == second
+        assert -0.1 <= first - 0.5 <= 0.1
+    
+    def test_rule_is_immutable(self):
+        """Test that rules are frozen so cached rule sets can be shared."""
+        rule = MutationRule(parameter="bpm", weight=2.0)
+        
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            rule.weight = 5.0
+        assert not hasattr(rule, "__dict__")
+
 
 class TestMutationEngine:
     """Test mutation engine functionality."""
@@ -124,6 +144,32 @@ class TestMutationEngine:
         removed = engine.remove_rule("nonexistent")
         assert not removed
     
+    def test_add_rule_replaces_existing(self, engine):
+        """Test that adding a rule for an existing parameter replaces it."""
+        initial_count = len(engine._rules)
+        
+        engine.add_rule(MutationRule(parameter="bpm", weight=9.0))
+        
+        assert len(engine._rules) == initial_count
+        assert engine._rules["bpm"].weight == 9.0
+    
+    def test_total_weight_tracking(self, engine):
+        """Test that the cached total weight follows add/replace/remove/clear."""
+        expected = sum(rule.weight for rule in engine._rules.values())
+        assert engine._total_weight == pytest.approx(expected)
+        
+        engine.add_rule(MutationRule(parameter="custom_param", weight=2.5))
+        engine.add_rule(MutationRule(parameter="bpm", weight=9.0))  # Replaces weight 2.0
+        expected += 2.5 + 7.0
+        assert engine._total_weight == pytest.approx(expected)
+        
+        engine.remove_rule("custom_param")
+        assert engine._total_weight == pytest.approx(expected - 2.5)
+        
+        engine.clear_rules()
+        assert engine._total_weight == 0.0
+        assert engine._select_mutation_rules() == []
+    
     def test_rule_selection(self, engine, state):
         """Test weighted rule selection."""
         # Add test parameters to state
@@ -132,7 +178,7 @@ class TestMutationEngine:
         state.set("test_param3", 3.0)
         
         # Clear existing rules and add test rules
-        engine._rules.clear()
+        engine.clear_rules()
         engine.add_rule(MutationRule("test_param1", weight=1.0))
         engine.add_rule(MutationRule("test_param2", weight=3.0))  # Higher weight
         engine.add_rule(MutationRule("test_param3", weight=1.0))
@@ -162,12 +208,7 @@ class TestMutationEngine:
         initial_bpm = state.get("bpm")
         
         # Find BPM rule
-        bpm_rule = None
-        for rule in engine._rules:
-            if rule.parameter == "bpm":
-                bpm_rule = rule
-                break
-        
+        bpm_rule = engine._rules.get("bpm")
         assert bpm_rule is not None
         
         # Apply mutation
@@ -200,7 +241,48 @@ class TestMutationEngine:
         engine._apply_mutation(density_rule)
         final_density = state.get("density")
         assert final_density <= 1.0  # Should be clamped
-    
+
+    def test_mutation_rule_bounds(self, engine, state):
+        """Test that rule-specific bounds clamp parameters State does not validate."""
+        state.set("custom_param", 120)
+
+        engine.add_rule(MutationRule(
+            parameter="custom_param",
+            delta_range=(20.0, 30.0),  # Only positive deltas
+            bounds=(0, 127)
+        ))
+        assert engine._bounds["custom_param"] == (0, 127)
+
+        assert engine._apply_mutation(engine._rules["custom_param"])
+        assert state.get("custom_param") == 127
+
+    def test_replacing_bounded_rule_drops_old_bounds(self, engine, state):
+        """Test that a replacement rule without bounds is not clamped by the old rule's."""
+        state.set("custom_param", 100)
+
+        engine.add_rule(MutationRule(parameter="custom_param", bounds=(0, 10)))
+        engine.add_rule(MutationRule(parameter="custom_param", delta_range=(5.0, 6.0)))
+        assert "custom_param" not in engine._bounds
+
+        assert engine._apply_mutation(engine._rules["custom_param"])
+        assert state.get("custom_param") >= 105
+
+    def test_remove_then_readd_rule_drops_old_bounds(self, engine, state):
+        """Test that removed and cleared rules leave no bounds behind."""
+        state.set("custom_param", 100)
+
+        engine.add_rule(MutationRule(parameter="custom_param", bounds=(0, 10)))
+        assert engine.remove_rule("custom_param")
+        assert "custom_param" not in engine._bounds
+
+        engine.add_rule(MutationRule(parameter="custom_param", delta_range=(5.0, 6.0)))
+        assert engine._apply_mutation(engine._rules["custom_param"])
+        assert state.get("custom_param") >= 105
+
+        engine.add_rule(MutationRule(parameter="custom_param", bounds=(0, 10)))
+        engine.clear_rules()
+        assert engine._bounds == {}
+
     def test_start_stop(self, engine):
         """Test starting and stopping the engine."""
         assert not engine._running
@@ -210,8 +292,8 @@ class TestMutationEngine:
         assert engine._running
         assert engine._thread is not None
         
-        # Wait a bit to ensure thread is running
-        time.sleep(0.1)
+        # Wait for the thread to signal that it is running
+        assert engine._started.wait(1.0)
         assert engine._thread.is_alive()
         
         # Stop engine
@@ -219,7 +301,7 @@ class TestMutationEngine:
         assert not engine._running
         
         # Thread should terminate
-        time.sleep(0.1)
+        assert engine._stopped.wait(1.0)
         assert not engine._thread.is_alive()
     
     def test_force_mutation(self, engine, state):
@@ -241,7 +323,7 @@ class TestMutationEngine:
         engine._mutations_enabled = True
         
         # Set next mutation time in the past
-        engine._next_mutation_time = time.time() - 1.0
+        engine._next_mutation_time_ns = time.monotonic_ns() - 1_000_000_000
         
         initial_history_len = len(engine._history)
         engine.maybe_mutate()
@@ -250,7 +332,30 @@ class TestMutationEngine:
         assert len(engine._history) > initial_history_len
         
         # Next mutation time should be updated
-        assert engine._next_mutation_time > time.time()
+        assert engine._next_mutation_time_ns > time.monotonic_ns()
+    
+    def test_external_tick_driver(self, state):
+        """Test that external_tick runs without a thread and is driven by maybe_mutate."""
+        config = MutationConfig(interval_min_s=1, interval_max_s=2, external_tick=True)
+        engine = MutationEngine(config, state)
+        engine._mutations_enabled = True
+        
+        engine.start()
+        try:
+            assert engine._running
+            assert engine._thread is None
+            
+            # Not due yet - nothing happens
+            engine.maybe_mutate()
+            assert len(engine._history) == 0
+            
+            # Due - the main loop tick performs the cycle
+            engine._next_mutation_time_ns = time.monotonic_ns() - 1_000_000_000
+            engine.maybe_mutate()
+            assert len(engine._history) > 0
+        finally:
+            engine.stop()
+        assert not engine._running
     
     def test_get_stats(self, engine):
         """Test statistics retrieval."""
@@ -334,6 +439,7 @@ class TestMutationEngine:
         """Test thread safety of mutation operations."""
         # Start engine
         engine.start()
+        assert engine._started.wait(1.0)
         
         try:
             # Perform operations from multiple threads
@@ -341,7 +447,6 @@ class TestMutationEngine:
                 for _ in range(10):
                     engine.get_stats()
                     engine.get_history()
-                    time.sleep(0.01)
             
             threads = [threading.Thread(target=stress_test) for _ in range(3)]
             
@@ -20,6 +20,9 @@ from config import MutationConfig
 from state import State
 from cc_profiles import get_profile
 
+# Parameter-name prefixes of the NTS-1 sections
+NTS1_PREFIXES = ('osc_', 'filter_', 'eg_', 'tremolo_', 'mod_', 'delay_', 'reverb_', 'arp_', 'master_')
+
 
 class TestNTS1MutationRules:
     """Test NTS-1 mutation rule generation."""
@@ -98,8 +101,7 @@ class TestNTS1MutationRules:
         for rule in all_rules:
             # Each rule should target a valid NTS-1 parameter
             # (Some rules might target sequencer parameters, which is OK)
-            if rule.parameter.startswith(('osc_', 'filter_', 'eg_', 'tremolo_', 
-                                        'mod_', 'delay_', 'reverb_', 'arp_', 'master_')):
+            if rule.parameter.startswith(NTS1_PREFIXES):
                 assert rule.parameter in valid_params, f"Invalid parameter: {rule.parameter}"
 
 
@@ -157,7 +159,7 @@ class TestNTS1MutationEngine:
         assert len(engine._rules) > initial_rule_count
         
         # Check that we have NTS-1 parameter rules
-        nts1_params = [rule.parameter for rule in engine._rules 
+        nts1_params = [rule.parameter for rule in engine._rules.values() 
                       if rule.parameter.startswith(('osc_', 'filter_', 'eg_', 'reverb_', 'delay_'))]
         assert len(nts1_params) > 0
     
@@ -201,13 +203,13 @@ class TestNTS1MutationEngine:
             # Check that we have style-appropriate rules
             if style == "ambient":
                 # Should have gentler rules
-                gentle_rules = [rule for rule in engine._rules 
+                gentle_rules = [rule for rule in engine._rules.values() 
                                if hasattr(rule, 'delta_scale') and rule.delta_scale < 1.0]
                 assert len(gentle_rules) > 0
             
             elif style == "rhythmic":
                 # Should have more aggressive filter rules
-                filter_rules = [rule for rule in engine._rules 
+                filter_rules = [rule for rule in engine._rules.values() 
                                if rule.parameter == "filter_cutoff"]
                 if filter_rules:
                     # Find the rhythmic-specific filter rule (there should be at least one with high weight)
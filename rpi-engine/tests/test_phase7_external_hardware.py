@@ -7,47 +7,69 @@ import pytest
 import time
 from unittest.mock import Mock, MagicMock
 from cc_profiles import CCParameter, CCProfile, CurveType, CCProfileRegistry
-from midi_clock import MidiClock, ClockStatus
+from midi_clock import MidiClock, ClockStatus, MidiClockAdapter
 from latency_optimizer import LatencyOptimizer, CCThrottler
 from external_hardware import ExternalHardwareManager
 
 
+@pytest.fixture(scope="module")
+def registry():
+    """Fresh CC profile registry with only the built-in profiles."""
+    return CCProfileRegistry()
+
+
 class TestCCProfiles:
     """Test CC profile system."""
     
-    def test_cc_parameter_linear_scaling(self):
-        """Test linear parameter scaling."""
-        param = CCParameter(cc=74, range=(0, 127), curve=CurveType.LINEAR)
-        
-        assert param.scale_value(0.0) == 0
-        assert param.scale_value(0.5) == 63
-        assert param.scale_value(1.0) == 127
+    @pytest.mark.parametrize("curve,norm,expected", [
+        # Linear
+        (CurveType.LINEAR, 0.0, 0),
+        (CurveType.LINEAR, 0.5, 63),
+        (CurveType.LINEAR, 1.0, 127),
+        # Exponential
+        (CurveType.EXPONENTIAL, 0.0, 0),
+        (CurveType.EXPONENTIAL, 0.5, 31),   # 0.5^2 * 127 ≈ 31
+        (CurveType.EXPONENTIAL, 1.0, 127),
+    ])
+    def test_cc_parameter_curve_scaling(self, curve, norm, expected):
+        """Test linear and exponential parameter scaling."""
+        param = CCParameter(cc=74, range=(0, 127), curve=curve)
+        assert param.scale_value(norm) == expected
     
-    def test_cc_parameter_exponential_scaling(self):
-        """Test exponential parameter scaling."""
-        param = CCParameter(cc=74, range=(0, 127), curve=CurveType.EXPONENTIAL)
-        
-        assert param.scale_value(0.0) == 0
-        assert param.scale_value(0.5) == 31  # 0.5^2 * 127 ≈ 31
-        assert param.scale_value(1.0) == 127
-    
-    def test_cc_parameter_stepped_scaling(self):
+    @pytest.mark.parametrize("norm,expected", [
+        (0.0, 0),
+        (0.33, 0),    # Step 0 of 4 (0.33 * 3 = 0.99 -> int(0) -> 0/3 = 0)
+        (0.50, 42),   # Step 1 of 4 (0.5 * 3 = 1.5 -> int(1) -> 1/3 = 0.33 * 127 = 42)
+        (0.75, 84),   # Step 2 of 4 (0.75 * 3 = 2.25 -> int(2) -> 2/3 = 0.67 * 127 = 84)
+        (1.0, 127),   # Step 3 of 4
+    ])
+    def test_cc_parameter_stepped_scaling(self, norm, expected):
         """Test stepped parameter scaling."""
         param = CCParameter(cc=70, range=(0, 127), curve=CurveType.STEPPED, steps=4)
+        assert param.scale_value(norm) == expected
+    
+    def test_cc_parameter_curves_stay_in_range(self):
+        """Test every curve keeps scaled values inside the parameter range."""
+        inputs = [i / 100 for i in range(-50, 151)]
+        for curve in (CurveType.LINEAR, CurveType.EXPONENTIAL, CurveType.LOGARITHMIC):
+            param = CCParameter(cc=74, range=(20, 100), curve=curve)
+            values = param.scale_values(inputs)
+            assert min(values) == 20
+            assert max(values) == 100
+    
+    def test_cc_parameter_stepped_batch_scaling(self):
+        """Test batch scaling matches per-value stepped scaling."""
+        param = CCParameter(cc=70, range=(10, 100), curve=CurveType.STEPPED, steps=5)
         
-        assert param.scale_value(0.0) == 0
-        assert param.scale_value(0.33) == 0    # Step 0 of 4 (0.33 * 3 = 0.99 -> int(0) -> 0/3 = 0)
-        assert param.scale_value(0.50) == 42   # Step 1 of 4 (0.5 * 3 = 1.5 -> int(1) -> 1/3 = 0.33 * 127 = 42)
-        assert param.scale_value(0.75) == 84   # Step 2 of 4 (0.75 * 3 = 2.25 -> int(2) -> 2/3 = 0.67 * 127 = 85)
-        assert param.scale_value(1.0) == 127   # Step 3 of 4
+        values = [-0.5, 0.0, 0.2, 0.25, 0.5, 0.74, 0.99, 1.0, 1.5]
+        assert param.scale_values(values) == [param.scale_value(v) for v in values]
+        assert param.scale_values([i / 4 for i in range(5)]) == [10, 32, 55, 77, 100]
     
-    def test_cc_parameter_range_clamping(self):
+    @pytest.mark.parametrize("norm,expected", [(0.0, 20), (0.5, 60), (1.0, 100)])
+    def test_cc_parameter_range_clamping(self, norm, expected):
         """Test parameter value clamping."""
         param = CCParameter(cc=74, range=(20, 100), curve=CurveType.LINEAR)
-        
-        assert param.scale_value(0.0) == 20
-        assert param.scale_value(0.5) == 60
-        assert param.scale_value(1.0) == 100
+        assert param.scale_value(norm) == expected
     
     def test_cc_profile_parameter_mapping(self):
         """Test CC profile parameter mapping."""
@@ -65,10 +87,21 @@ class TestCCProfiles:
         result = profile.map_parameter("nonexistent", 0.5)
         assert result is None
     
-    def test_cc_profile_registry(self):
-        """Test CC profile registry functionality."""
-        registry = CCProfileRegistry()
+    def test_cc_profile_batch_mapping(self):
+        """Test mapping several parameters in one call."""
+        profile = CCProfile(
+            name="Test Profile",
+            parameters={
+                "filter_cutoff": CCParameter(cc=74, range=(0, 127)),
+                "filter_resonance": CCParameter(cc=71, range=(0, 127))
+            }
+        )
         
+        result = profile.map_parameters({"filter_cutoff": 0.5, "filter_resonance": 1.0, "nonexistent": 0.5})
+        assert result == {"filter_cutoff": (74, 63), "filter_resonance": (71, 127)}
+    
+    def test_cc_profile_registry(self, registry):
+        """Test CC profile registry functionality."""
         # Test built-in profiles are loaded
         profiles = registry.list_profiles()
         assert "korg_nts1_mk2" in profiles
@@ -82,6 +115,32 @@ class TestCCProfiles:
         assert "filter_cutoff" in nts1_profile.parameters
 
 
+class CountingClockSender:
+    """Clock sender that only counts calls (the clock thread ticks it often)."""
+    
+    def __init__(self):
+        self.clock_calls = 0
+        self.start_calls = 0
+        self.stop_calls = 0
+        self.continue_calls = 0
+        self.song_positions = []
+    
+    def send_clock(self) -> None:
+        self.clock_calls += 1
+    
+    def send_start(self) -> None:
+        self.start_calls += 1
+    
+    def send_stop(self) -> None:
+        self.stop_calls += 1
+    
+    def send_continue(self) -> None:
+        self.continue_calls += 1
+    
+    def send_song_position(self, position: int) -> None:
+        self.song_positions.append(position)
+
+
 class TestMidiClock:
     """Test MIDI clock functionality."""
     
@@ -108,18 +167,18 @@ class TestMidiClock:
     
     def test_clock_start_stop(self):
         """Test clock start/stop functionality."""
-        mock_sender = Mock()
-        clock = MidiClock(mock_sender)
+        sender = CountingClockSender()
+        clock = MidiClock(sender)
         
         # Test start
         clock.start()
         assert clock.status.running
-        mock_sender.send_start.assert_called_once()
+        assert sender.start_calls == 1
         
         # Test stop
         clock.stop()
         assert not clock.status.running
-        mock_sender.send_stop.assert_called_once()
+        assert sender.stop_calls == 1
     
     def test_song_position_setting(self):
         """Test song position setting."""
@@ -130,6 +189,19 @@ class TestMidiClock:
         assert clock.status.song_position == 16
         assert clock.status.position == 96  # 16 * 6 (24 PPQN / 4)
         mock_sender.send_song_position.assert_called_with(16)
+    
+    def test_clock_adapter_sends_realtime_messages(self):
+        """Test the adapter sends realtime messages to the output port."""
+        mock_output = Mock()
+        adapter = MidiClockAdapter(mock_output)
+        
+        adapter.send_start()
+        adapter.send_clock()
+        adapter.send_clock()
+        adapter.send_stop()
+        
+        sent = [call.args[0] for call in mock_output.port.send.call_args_list]
+        assert [msg.type for msg in sent] == ['start', 'clock', 'clock', 'stop']
 
 
 class TestCCThrottler:
@@ -168,6 +240,21 @@ class TestCCThrottler:
         pending = throttler.get_pending_messages()
         assert len(pending) == 1
         assert pending[0] == (1, 74, 65)
+    
+    def test_pending_messages_wait_for_throttle_window(self):
+        """Test pending CCs are held until their window ends and keep the latest value."""
+        throttler = CCThrottler(throttle_ms=30)
+        
+        throttler.should_send_cc(1, 74, 64)
+        throttler.should_send_cc(1, 74, 65)
+        throttler.should_send_cc(1, 74, 66)
+        
+        # Still inside the throttle window
+        assert throttler.get_pending_messages() == []
+        
+        time.sleep(0.04)  # 40ms
+        assert throttler.get_pending_messages() == [(1, 74, 66)]
+        assert throttler.get_pending_messages() == []
 
 
 class TestLatencyOptimizer:
@@ -198,6 +285,19 @@ class TestLatencyOptimizer:
         optimizer.send_immediate('cc', cc=74, value=64, channel=1)
         mock_output.send_control_change.assert_called_with(74, 64, 1)
     
+    def test_cc_batch_sending(self):
+        """Test sending released CCs in one batch."""
+        mock_output = Mock()
+        mock_output.send_control_change.side_effect = [True, False, True]
+        
+        optimizer = LatencyOptimizer(mock_output)
+        
+        sent = optimizer.send_cc_batch([(1, 74, 64), (1, 71, 10), (2, 74, 90)])
+        assert sent == 2
+        assert mock_output.send_control_change.call_count == 3
+        mock_output.send_control_change.assert_called_with(74, 90, 2)
+        assert optimizer.stats.total_messages == 2
+    
     def test_scheduled_message_queueing(self):
         """Test scheduled message queueing."""
         mock_output = Mock()
@@ -209,8 +309,22 @@ class TestLatencyOptimizer:
         assert optimizer.message_queue.size() == 1
         
         # Message should not be ready yet
-        ready = optimizer.message_queue.get_ready_messages(time.perf_counter())
+        ready = optimizer.message_queue.get_ready_messages(time.perf_counter_ns())
         assert len(ready) == 0
+    
+    def test_scheduled_messages_ready_in_time_order(self):
+        """Test that due messages are released even when later ones are queued."""
+        mock_output = Mock()
+        optimizer = LatencyOptimizer(mock_output)
+        
+        now = time.perf_counter()
+        optimizer.schedule_note_off(60, 1, now + 10.0)
+        optimizer.schedule_note_on(62, 100, 1, now - 0.01)
+        optimizer.schedule_note_on(61, 100, 1, now - 0.02)
+        
+        ready = optimizer.message_queue.get_ready_messages(time.perf_counter_ns())
+        assert [m.data['note'] for m in ready] == [61, 62]
+        assert optimizer.message_queue.size() == 1
 
 
 class TestExternalHardwareManager:
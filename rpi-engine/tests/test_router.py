@@ -1,19 +1,22 @@
 from router import Router
-from config import load_config
 from events import SemanticEvent
 import mido
 
+# Built once; tests retarget them with .copy(channel=...)
+_NOTE_ON_60 = mido.Message("note_on", note=60, velocity=100)
+_NOTE_OFF_60 = mido.Message("note_off", note=60, velocity=0)
+_CC_24 = mido.Message("control_change", control=24, value=64)
 
-def collect_events(cfg_path="tests/test.yaml"):
-    cfg = load_config(cfg_path)
+
+def collect_events(cfg):
     events = []
     r = Router(cfg, lambda e: events.append(e))
-    return r, events, cfg
+    return r, events
 
 
-def test_note_mapping_triggers_event():
-    router, events, cfg = collect_events()
-    msg = mido.Message("note_on", note=60, velocity=100, channel=cfg.midi.input_channel - 1)
+def test_note_mapping_triggers_event(cfg):
+    router, events = collect_events(cfg)
+    msg = _NOTE_ON_60.copy(channel=cfg.midi.input_channel - 1)
     router.route(msg)
     assert len(events) == 1
     evt = events[0]
@@ -23,9 +26,9 @@ def test_note_mapping_triggers_event():
     assert evt.value == 100
 
 
-def test_cc_mapping_triggers_event():
-    router, events, cfg = collect_events()
-    msg = mido.Message("control_change", control=24, value=64, channel=cfg.midi.input_channel - 1)
+def test_cc_mapping_triggers_event(cfg):
+    router, events = collect_events(cfg)
+    msg = _CC_24.copy(channel=cfg.midi.input_channel - 1)
     router.route(msg)
     assert len(events) == 1
     evt = events[0]
@@ -34,18 +37,18 @@ def test_cc_mapping_triggers_event():
     assert evt.value == 64
 
 
-def test_channel_filter():
-    router, events, cfg = collect_events()
+def test_channel_filter(cfg):
+    router, events = collect_events(cfg)
     other_channel = (cfg.midi.input_channel % 16)  # different 0-based channel
-    msg = mido.Message("note_on", note=60, velocity=100, channel=other_channel)
+    msg = _NOTE_ON_60.copy(channel=other_channel)
     router.route(msg)
     assert events == []
 
 
-def test_note_off_ignored_phase1():
-    router, events, cfg = collect_events()
-    msg_on = mido.Message("note_on", note=60, velocity=100, channel=cfg.midi.input_channel - 1)
+def test_note_off_ignored_phase1(cfg):
+    router, events = collect_events(cfg)
+    msg_on = _NOTE_ON_60.copy(channel=cfg.midi.input_channel - 1)
     router.route(msg_on)
-    msg_off = mido.Message("note_off", note=60, velocity=0, channel=cfg.midi.input_channel - 1)
+    msg_off = _NOTE_OFF_60.copy(channel=cfg.midi.input_channel - 1)
     router.route(msg_off)
     assert len(events) == 1
@@ -1,11 +1,9 @@
 from router import Router
-from config import load_config
 import mido
 import pytest
 
 
-def test_unmapped_note_ignored():
-    cfg = load_config("tests/test.yaml")
+def test_unmapped_note_ignored(cfg):
     events = []
     r = Router(cfg, events.append)
     msg = mido.Message("note_on", note=12, velocity=100, channel=cfg.midi.input_channel - 1)
@@ -13,8 +11,7 @@ def test_unmapped_note_ignored():
     assert events == []
 
 
-def test_unmapped_cc_ignored():
-    cfg = load_config("tests/test.yaml")
+def test_unmapped_cc_ignored(cfg):
     events = []
     r = Router(cfg, events.append)
     msg = mido.Message(
@@ -1,12 +1,30 @@
 """Tests for sequencer module."""
 
+import os
 import pytest
+import threading
 import time
 from unittest.mock import Mock, patch
 from state import State
 from sequencer import HighResClock, Sequencer, TickEvent, NoteEvent, create_sequencer
 
 
+class _Counter:
+    """Cheap tick callback; Mock's call bookkeeping would skew clock timing."""
+    __slots__ = ('n', 'last', 'ticked')
+    
+    def __init__(self):
+        self.n = 0
+        self.last = None
+        self.ticked = threading.Event()  # Set on the first tick
+    
+    def __call__(self, tick):
+        self.n += 1
+        self.last = tick
+        if self.n == 1:
+            self.ticked.set()
+
+
 @pytest.fixture
 def state():
     """Fresh state instance for each test."""
@@ -30,45 +48,96 @@ def test_clock_parameter_updates():
     
     assert clock.bpm == 120.0
     assert clock.swing == 0.1
+    # Derived timing used by the clock thread follows the new values
+    assert clock._tick_interval == pytest.approx(60.0 / (120.0 * 24))
+    assert clock.tick_interval == clock._tick_interval
+    assert clock._swing_offset == pytest.approx(clock._tick_interval * 0.1)
+    # ppq=24: ticks 6-11 of every 12 are swung
+    assert len(clock._swing_offsets) == 12
+    assert [offset > 0.0 for offset in clock._swing_offsets] == [False] * 6 + [True] * 6
 
 
 def test_clock_start_stop():
     """Test starting and stopping the clock."""
     clock = HighResClock()
-    mock_callback = Mock()
-    clock.set_tick_callback(mock_callback)
+    counter = _Counter()
+    clock.set_tick_callback(counter)
     
     # Start clock
     clock.start()
     assert clock._running is True
     assert clock._thread is not None
     
-    # Let it run briefly
-    time.sleep(0.1)
+    # Let it run until the first tick arrives
+    assert counter.ticked.wait(timeout=1.0)
     
     # Stop clock
     clock.stop()
     assert clock._running is False
     
     # Verify we got some ticks
-    assert mock_callback.call_count > 0
+    assert counter.n > 0
+    assert isinstance(counter.last, TickEvent)
+
+
+@pytest.mark.skipif(not hasattr(os, "sched_setaffinity"), reason="CPU affinity not supported")
+def test_clock_thread_cpu_pinning():
+    """Test that the clock thread pins itself to the configured CPU."""
+    cpu = min(os.sched_getaffinity(0))
+    thread_affinity = []
+    
+    class RecordingClock(HighResClock):
+        def _apply_thread_scheduling(self):
+            super()._apply_thread_scheduling()
+            thread_affinity.append(os.sched_getaffinity(0))
+    
+    clock = RecordingClock(bpm=240.0, ppq=4)
+    clock.set_thread_scheduling(cpu=cpu)
+    clock.set_tick_callback(lambda tick: None)
+    clock.start()
+    time.sleep(0.1)
+    clock.stop()
+    
+    assert thread_affinity == [{cpu}]
+
+
+def test_slow_tick_callback_does_not_delay_clock():
+    """Test that ticks keep their timing when the callback is slow."""
+    clock = HighResClock(bpm=300.0, ppq=4)  # 50ms per tick
+    received_ticks = []
+    
+    def tick_callback(tick):
+        received_ticks.append(tick)
+        time.sleep(0.08)  # Longer than a tick interval
+    
+    clock.set_tick_callback(tick_callback)
+    clock.start()
+    time.sleep(0.5)
+    clock.stop()
+    
+    assert len(received_ticks) >= 3
+    intervals = [b.timestamp - a.timestamp for a, b in zip(received_ticks, received_ticks[1:])]
+    # Timestamps follow the clock, not the callback's pace
+    assert max(intervals) < 0.07
 
 
 def test_clock_tick_events():
     """Test that clock generates tick events with correct structure."""
     clock = HighResClock(bpm=240.0, ppq=4)  # Fast for testing
     received_ticks = []
+    done = threading.Event()
     
     def tick_callback(tick):
         received_ticks.append(tick)
         if len(received_ticks) >= 8:  # Stop after 8 ticks (2 beats)
             clock.stop()
+            done.set()
     
     clock.set_tick_callback(tick_callback)
     clock.start()
     
     # Wait for ticks
-    time.sleep(0.5)
+    assert done.wait(timeout=1.0)
     
     # Verify tick structure
     assert len(received_ticks) >= 4
@@ -80,11 +149,54 @@ def test_clock_tick_events():
         assert 0 <= tick.step < clock.ppq
 
 
+def test_bpm_change_does_not_burst_ticks():
+    """Test that speeding up mid-run doesn't fire a burst of catch-up ticks."""
+    clock = HighResClock(bpm=240.0, ppq=4)  # 62.5ms per tick
+    timestamps = []
+    done = threading.Event()
+    
+    def tick_callback(tick):
+        timestamps.append(tick.timestamp)
+        if len(timestamps) == 4:
+            clock.update_params(bpm=480.0)  # 31.25ms per tick
+        elif len(timestamps) >= 8:
+            clock.stop()
+            done.set()
+    
+    clock.set_tick_callback(tick_callback)
+    clock.start()
+    assert done.wait(timeout=2.0)
+    
+    intervals = [b - a for a, b in zip(timestamps[4:], timestamps[5:])]
+    assert min(intervals) > 0.02
+
+
+def test_clock_records_tick_timing(tmp_path):
+    """Test that the clock writes one timing record per tick when asked."""
+    from sequencer import TIMING_RECORD
+    
+    path = tmp_path / "timing.bin"
+    clock = HighResClock(bpm=240.0, ppq=4)
+    counter = _Counter()
+    clock.set_tick_callback(counter)
+    clock.set_timing_file(str(path))
+    clock.start()
+    assert counter.ticked.wait(timeout=1.0)
+    time.sleep(0.2)
+    clock.stop()
+    
+    records = list(TIMING_RECORD.iter_unpack(path.read_bytes()))
+    assert len(records) >= 2
+    assert [r[0] for r in records] == list(range(len(records)))
+    assert all(actual >= deadline for _, deadline, actual in records)
+
+
 def test_swing_application():
     """Test that swing is applied to appropriate ticks."""
     clock = HighResClock(bpm=120.0, ppq=8, swing=0.5)
     swing_ticks = []
     regular_ticks = []
+    done = threading.Event()
     
     def tick_callback(tick):
         if tick.swing_adjusted:
@@ -92,12 +204,14 @@ def test_swing_application():
         else:
             regular_ticks.append(tick.step)
         
-        if len(swing_ticks) + len(regular_ticks) >= 16:
+        # 8 ticks cover two swung pairs (ticks 2-3 and 6-7)
+        if len(swing_ticks) + len(regular_ticks) >= 8:
             clock.stop()
+            done.set()
     
     clock.set_tick_callback(tick_callback)
     clock.start()
-    time.sleep(0.5)
+    assert done.wait(timeout=2.0)
     
     # With ppq=8 and swing, every other 2nd tick should be swing-adjusted
     # (every 4th tick: 2, 6, 10, 14, etc.)
@@ -190,12 +304,14 @@ def test_sequencer_integration(state):
     scales = ['major', 'minor']
     sequencer = Sequencer(state, scales)
     generated_notes = []
+    done = threading.Event()
     
     def note_callback(note_event):
         generated_notes.append(note_event)
         # Stop after a few notes to avoid long test
         if len(generated_notes) >= 3:
             sequencer.stop()
+            done.set()
     
     sequencer.set_note_callback(note_callback)
     
@@ -207,7 +323,8 @@ def test_sequencer_integration(state):
     sequencer.start()
     
     # Wait for notes
-    time.sleep(0.5)
+    assert done.wait(timeout=2.0)
+    sequencer.stop()
     
     # Verify we got some notes
     assert len(generated_notes) > 0
@@ -231,6 +348,25 @@ def test_sequencer_callback_exception_handling(state):
     sequencer._generate_step_note(0)
 
 
+def test_repeated_callback_errors_logged_once(state, caplog):
+    """Test that a callback failing the same way every step is logged once."""
+    sequencer = Sequencer(state, ['major'])
+    state.set('density', 1.0)
+    state.set('step_probabilities', [1.0] * 8)
+    
+    def bad_callback(note_event):
+        raise RuntimeError("Callback error")
+    
+    sequencer.set_note_callback(bad_callback)
+    with caplog.at_level('ERROR', logger='sequencer'):
+        for _ in range(3):
+            sequencer._generate_step_note(0)
+    
+    assert len(sequencer._callback_errors) == 3
+    assert sequencer._callback_errors[-1] == ('RuntimeError', 'Callback error')
+    assert [r.getMessage() for r in caplog.records] == ["Note callback error: Callback error"]
+
+
 def test_create_sequencer_factory():
     """Test the factory function."""
     state = State()
@@ -261,6 +397,22 @@ def test_sequence_length_change_handling(state):
     assert 0 <= current_step < sequence_length
 
 
+def test_step_parameters_follow_state(state):
+    """Test that step parameters cached by the sequencer track state changes."""
+    sequencer = Sequencer(state, ['major'])
+
+    state.set('sequence_length', 4)
+    state.set('direction_pattern', 'backward')
+    state.set('step_position', 0)
+    sequencer._advance_step()
+    assert state.get('step_position') == 3
+
+    state.update_multiple({'sequence_length': 6, 'direction_pattern': 'forward'}, coalesce=True)
+    state.set('step_position', 5)
+    sequencer._advance_step()
+    assert state.get('step_position') == 0
+
+
 # Phase 5.5 Tests: Enhanced Probability & Rhythm Patterns
 
 def test_set_step_probabilities(state):
@@ -366,6 +518,16 @@ def test_probability_presets(state):
     # Test unknown preset (should return default)
     unknown = sequencer.get_probability_preset('nonexistent', length=4)
     assert unknown == [0.9, 0.9, 0.9, 0.9]  # uniform default
+    
+    # Presets are fresh lists callers can modify
+    uniform[0] = 0.1
+    assert sequencer.get_probability_preset('uniform', length=4)[0] == 0.9
+    
+    # Single-step ramps and random presets
+    assert sequencer.get_probability_preset('crescendo', length=1) == [0.3]
+    random_high = sequencer.get_probability_preset('random_high', length=8)
+    assert len(random_high) == 8
+    assert all(0.6 <= p <= 1.0 for p in random_high)
 
 
 def test_enhanced_step_note_generation_with_arrays(state):
@@ -529,6 +691,17 @@ def test_ping_pong_direction_pattern(state):
     assert sequence[6] == 1  # Bounce forward from 0
 
 
+def test_ping_pong_after_sequence_shrinks(state):
+    """Test ping-pong from a step beyond a shortened sequence."""
+    sequencer = Sequencer(state, ['major'])
+    sequencer.set_direction_pattern('ping_pong')
+    
+    # Step 6 of a sequence that is now 4 long bounces back inside it
+    next_step = sequencer._get_next_step(6, 4)
+    assert next_step == 2
+    assert sequencer._get_next_step(next_step, 4) == 1
+
+
 def test_random_direction_pattern(state):
     """Test random direction pattern."""
     sequencer = Sequencer(state, ['major'])
@@ -557,6 +730,38 @@ def test_random_direction_pattern(state):
     assert len(unique_steps) > 1  # Should visit multiple different steps
 
 
+def test_random_direction_single_step_sequence(state):
+    """Test that random direction returns to step 0 once only one step is left."""
+    sequencer = Sequencer(state, ['major'])
+    sequencer.set_direction_pattern('random')
+    
+    assert sequencer._get_next_step(5, 1) == 0
+    assert sequencer._get_next_step(0, 1) == 0
+
+
+def test_seeded_sequencers_are_reproducible(state):
+    """Test that sequencers with the same seed make the same choices."""
+    state.set('step_probabilities', [0.5] * 8)
+    runs = []
+    for _ in range(2):
+        sequencer = Sequencer(state, ['major'], seed=1234)
+        sequencer.set_direction_pattern('random')
+        notes = []
+        sequencer.set_note_callback(notes.append)
+        
+        steps = []
+        current_step = 0
+        for _ in range(32):
+            sequencer._generate_step_note(current_step)
+            current_step = sequencer._get_next_step(current_step, 8)
+            steps.append(current_step)
+        runs.append((steps, [(n.note, n.velocity, n.step, n.duration) for n in notes]))
+    
+    assert runs[0] == runs[1]
+    # Every other step is reachable from the random pattern
+    assert set(runs[0][0]) == set(range(8))
+
+
 def test_direction_pattern_state_changes(state):
     """Test that direction pattern changes update internal state."""
     sequencer = Sequencer(state, ['major'])
@@ -596,3 +801,88 @@ def test_direction_pattern_advance_step_integration(state):
     sequencer._current_step = 0
     sequencer._advance_step()
     assert sequencer._current_step == 1
+
+
+def test_late_tick_drops_step_note(state):
+    """Test that a step handled a whole step late advances without playing."""
+    sequencer = Sequencer(state, ['major'])
+    notes = []
+    sequencer.set_note_callback(notes.append)
+    state.set('density', 1.0)
+    state.set('step_probabilities', [1.0] * 8)
+    state.set('step_pattern', [True] * 8)
+    
+    # On-time tick plays its note
+    sequencer._advance_step(TickEvent(step=0, timestamp=time.perf_counter()))
+    assert sequencer._current_step == 1
+    assert len(notes) == 1
+    
+    # A tick from a second ago is far past the step interval
+    sequencer._advance_step(TickEvent(step=0, timestamp=time.perf_counter() - 1.0))
+    assert sequencer._current_step == 2
+    assert state.get('step_position') == 2
+    assert len(notes) == 1
+    assert sequencer._dropped_steps == 1
+
+
+def test_step_duration_follows_bpm(state):
+    """Test that the cached step duration is refreshed on bpm changes."""
+    sequencer = Sequencer(state, ['major'])
+    state.set('bpm', 120.0)
+    assert sequencer._step_duration == pytest.approx(0.125)  # 16th notes at 120 BPM
+
+
+def test_sequencer_handles_coalesced_updates(state):
+    """Test that a batched state change reaches the clock and scale."""
+    sequencer = Sequencer(state, ['major', 'minor'])
+    sequencer._quantize_on_bar = False
+    
+    state.update_multiple(
+        {'bpm': 140.0, 'swing': 0.3, 'scale_index': 1, 'root_note': 62, 'step_position': 5},
+        source='test', coalesce=True
+    )
+    
+    assert sequencer.clock.bpm == 140.0
+    assert sequencer.clock.swing == 0.3
+    assert sequencer.scale_mapper.current_scale_name == 'minor'
+    assert sequencer.scale_mapper.root_note == 62
+    assert sequencer._current_step == 5
+
+
+def test_step_notes_follow_scale_change(state):
+    """Test that the precomputed step notes are rebuilt when the scale changes."""
+    notes = []
+    sequencer = Sequencer(state, ['major', 'minor'], seed=1)
+    sequencer._quantize_on_bar = False
+    sequencer.set_note_callback(notes.append)
+    state.update_multiple({'density': 1.0, 'note_probability': 1.0})
+    
+    state.set('scale_index', 1)
+    sequencer._generate_step_note(4)  # degree 2 of C minor
+    sequencer._generate_step_note(3)  # odd steps are silent by default
+    
+    assert [n.note for n in notes] == [63]
+
+
+def test_note_dispatcher_delivers_off_tick_thread(state):
+    """Test that a slow note callback doesn't hold up step generation."""
+    received = []
+    
+    def slow_callback(note_event):
+        time.sleep(0.05)
+        received.append((note_event.step, threading.current_thread().name))
+    
+    sequencer = Sequencer(state, ['major'], seed=1)
+    sequencer.set_note_callback(slow_callback)
+    state.update_multiple({'density': 1.0, 'note_probability': 1.0})
+    sequencer.start_note_dispatcher()
+    try:
+        start = time.monotonic()
+        for step in (0, 2, 4):
+            sequencer._generate_step_note(step)
+        assert time.monotonic() - start < 0.05
+    finally:
+        sequencer.stop_note_dispatcher()
+    
+    # Stopping drains the queue in order
+    assert received == [(0, 'note-dispatch'), (2, 'note-dispatch'), (4, 'note-dispatch')]
@@ -3,7 +3,7 @@
 import pytest
 import time
 from unittest.mock import Mock
-from state import State, StateChange, get_state, reset_state
+from state import State, StateChange, BATCH_PARAMETER, get_state, reset_state
 
 
 @pytest.fixture
@@ -98,6 +98,17 @@ def test_no_change_no_notification():
     mock_listener.assert_not_called()
 
 
+def test_set_without_notify():
+    """Test that notify=False updates the value without calling listeners."""
+    state = State()
+    mock_listener = Mock()
+    state.add_listener(mock_listener)
+    
+    assert state.set('step_position', 3, source='sequencer', notify=False) is True
+    assert state.get('step_position') == 3
+    mock_listener.assert_not_called()
+
+
 def test_listener_exception_handling():
     """Test that listener exceptions don't break state updates."""
     state = State()
@@ -158,6 +169,97 @@ def test_update_multiple():
     assert mock_listener.call_count == 3
 
 
+def test_update_multiple_coalesced():
+    """Test that coalesce=True sends one batched change per listener."""
+    state = State()
+    mock_listener = Mock()
+    state.add_listener(mock_listener)
+    
+    changes = state.update_multiple({'bpm': 120.0, 'swing': 0.2, 'density': 0.85}, source='batch', coalesce=True)
+    assert changes == 2  # density already 0.85
+    
+    mock_listener.assert_called_once()
+    change = mock_listener.call_args[0][0]
+    assert change.parameter == BATCH_PARAMETER
+    assert change.old_value == {'bpm': 110.0, 'swing': 0.12}
+    assert change.new_value == {'bpm': 120.0, 'swing': 0.2}
+    assert change.source == 'batch'
+
+
+def test_update_multiple_without_overwrite():
+    """Test that overwrite=False only fills in missing parameters."""
+    state = State()
+    state.set('bpm', 120.0)
+    mock_listener = Mock()
+    state.add_listener(mock_listener)
+
+    changes = state.update_multiple({'bpm': 90.0, 'osc_shape': 42}, source='init', overwrite=False)
+    assert changes == 1
+
+    assert state.get('bpm') == 120.0  # Existing value kept
+    assert state.get('osc_shape') == 42
+    assert mock_listener.call_count == 1
+    assert mock_listener.call_args[0][0].source == 'init'
+
+
+def test_dispatcher_delivers_changes_async():
+    """Test that listeners run on the dispatcher thread once started."""
+    import threading
+    
+    state = State()
+    received = []
+    state.add_listener(lambda change: received.append((change, threading.current_thread().name)))
+    state.start_dispatcher()
+    try:
+        state.set('bpm', 120.0, source='test')
+        state.update_multiple({'swing': 0.2, 'density': 0.5}, source='batch')
+        assert state.flush_events() is True
+        
+        assert [c.parameter for c, _ in received] == ['bpm', 'swing', 'density']
+        assert all(name == 'state-dispatch' for _, name in received)
+    finally:
+        state.stop_dispatcher()
+    
+    # Back to synchronous delivery
+    state.set('bpm', 130.0)
+    assert received[-1][0].new_value == 130.0
+    assert received[-1][1] == threading.current_thread().name
+
+
+def test_get_does_not_wait_for_writers():
+    """Test that reads proceed while another thread holds the write lock."""
+    import threading
+    
+    state = State()
+    locked = threading.Event()
+    release = threading.Event()
+    
+    def hold_lock():
+        with state._lock:
+            locked.set()
+            release.wait(2.0)
+    
+    writer = threading.Thread(target=hold_lock)
+    writer.start()
+    try:
+        assert locked.wait(1.0)
+        start = time.monotonic()
+        assert state.get('bpm') == 110.0
+        assert time.monotonic() - start < 0.5
+    finally:
+        release.set()
+        writer.join()
+
+
+def test_get_many():
+    """Test reading several parameters at once."""
+    state = State()
+    state.set('bpm', 120.0)
+    
+    values = state.get_many({'bpm': 0.0, 'density': 0.0, 'missing_param': 'fallback'})
+    assert values == (120.0, 0.85, 'fallback')
+
+
 def test_get_all():
     """Test getting all parameters."""
     state = State()